@@ -0,0 +1,238 @@
+"""
+Client registry for the Enhanced Codegen UI backend.
+
+This module keeps long-lived Codegen clients so that connection pools,
+request coalescing and other per-client state survive between requests.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from codegen_client import CodegenClient
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+class _RegistryEntry:
+    """A registered client and its usage counters."""
+
+    def __init__(self, key_hash: str, client: CodegenClient):
+        self.key_hash = key_hash
+        self.client = client
+        self.created_at = time.time()
+        self.last_used_at = self.created_at
+        self.total_leases = 0
+        self.active_leases = 0
+        self.retired = False
+
+
+class ClientRegistry:
+    """
+    Bounded registry of long-lived Codegen clients.
+
+    Clients are keyed by a hash of the API key, so each tenant gets its own
+    connection pool while the raw key is never stored. When the registry is
+    full the least recently used client is evicted; it is closed as soon as
+    no request is still using it.
+    """
+
+    def __init__(
+        self,
+        max_clients: int = 64,
+        client_factory: Optional[Callable[[str], CodegenClient]] = None,
+    ):
+        """
+        Initialize the client registry.
+
+        Args:
+            max_clients: Maximum number of clients to keep open
+            client_factory: Function that creates a client for an API key
+        """
+        if max_clients < 1:
+            raise ValueError("max_clients must be at least 1")
+
+        self.max_clients = max_clients
+        self.client_factory = client_factory or (lambda api_key: CodegenClient(api_key=api_key))
+        self._entries: "OrderedDict[str, _RegistryEntry]" = OrderedDict()
+        # Entries with active leases, by id of their client
+        self._leased: Dict[int, _RegistryEntry] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def hash_api_key(api_key: str) -> str:
+        """
+        Hash an API key for use as a registry key.
+
+        Args:
+            api_key: Codegen API key
+
+        Returns:
+            str: SHA-256 hex digest of the API key
+        """
+        return hashlib.sha256(api_key.encode()).hexdigest()
+
+    def acquire(self, api_key: str) -> CodegenClient:
+        """
+        Get or create the client for an API key and take a lease on it.
+
+        Every call must be paired with ``release``.
+
+        Args:
+            api_key: Codegen API key
+
+        Returns:
+            CodegenClient: Long-lived client for the API key
+        """
+        key_hash = self.hash_api_key(api_key)
+        evicted: List[_RegistryEntry] = []
+
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Client registry is closed")
+
+            entry = self._entries.get(key_hash)
+            if entry is not None:
+                self._hits += 1
+                self._entries.move_to_end(key_hash)
+            else:
+                self._misses += 1
+                entry = _RegistryEntry(key_hash, self.client_factory(api_key))
+                self._entries[key_hash] = entry
+
+                # Evict least recently used clients beyond the limit
+                while len(self._entries) > self.max_clients:
+                    _, old_entry = self._entries.popitem(last=False)
+                    old_entry.retired = True
+                    self._evictions += 1
+                    if old_entry.active_leases == 0:
+                        evicted.append(old_entry)
+
+            entry.total_leases += 1
+            entry.active_leases += 1
+            entry.last_used_at = time.time()
+            self._leased[id(entry.client)] = entry
+
+        for old_entry in evicted:
+            self._close_entry(old_entry)
+
+        return entry.client
+
+    def release(self, client: CodegenClient):
+        """
+        Release a lease, closing the client if it was evicted meanwhile.
+
+        Args:
+            client: Client returned by ``acquire``
+        """
+        with self._lock:
+            entry = self._leased.get(id(client))
+            if entry is None:
+                return
+            entry.active_leases -= 1
+            if entry.active_leases == 0:
+                del self._leased[id(client)]
+            should_close = entry.retired and entry.active_leases == 0
+
+        if should_close:
+            self._close_entry(entry)
+
+    def _close_entry(self, entry: _RegistryEntry):
+        """
+        Close the client of a registry entry.
+
+        Args:
+            entry: Registry entry to close
+        """
+        try:
+            entry.client.close()
+            logger.info(f"Closed client for tenant {entry.key_hash[:12]}")
+        except Exception as e:
+            logger.error(f"Error closing client for tenant {entry.key_hash[:12]}: {str(e)}")
+
+    @contextmanager
+    def lease(self, api_key: str) -> Iterator[CodegenClient]:
+        """
+        Borrow the client for an API key for the duration of a request.
+
+        Args:
+            api_key: Codegen API key
+
+        Yields:
+            CodegenClient: Long-lived client for the API key
+        """
+        client = self.acquire(api_key)
+        try:
+            yield client
+        finally:
+            self.release(client)
+
+    def close(self):
+        """
+        Close all registered clients.
+        """
+        with self._lock:
+            self._closed = True
+            entries = list(self._entries.values())
+            self._entries.clear()
+            for entry in entries:
+                entry.retired = True
+
+        for entry in entries:
+            self._close_entry(entry)
+
+    def __len__(self) -> int:
+        """
+        Get the number of registered clients.
+
+        Returns:
+            int: Number of registered clients
+        """
+        return len(self._entries)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get registry and per-tenant client metrics.
+
+        Tenants are identified by a prefix of their API key hash.
+
+        Returns:
+            Dict[str, Any]: Registry counters and per-tenant client statistics
+        """
+        with self._lock:
+            entries = list(self._entries.values())
+            metrics: Dict[str, Any] = {
+                "max_clients": self.max_clients,
+                "clients": len(entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
+
+        tenants = []
+        for entry in entries:
+            tenants.append(
+                {
+                    "tenant": entry.key_hash[:12],
+                    "created_at": entry.created_at,
+                    "last_used_at": entry.last_used_at,
+                    "total_leases": entry.total_leases,
+                    "active_leases": entry.active_leases,
+                    "client": entry.client.get_stats(),
+                }
+            )
+        metrics["tenants"] = tenants
+        return metrics
@@ -7,21 +7,24 @@ endpoints for interacting with the Codegen API.
 
 import os
 import asyncio
+import hmac
 import logging
 import uuid
+from contextlib import asynccontextmanager
 from typing import Dict, List, Optional, Any, Union, Callable
 
-from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, Query, Path, Body
+from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, Query, Path, Body, Header, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
-from concurrent.futures import ThreadPoolExecutor
-
 from codegen_client import CodegenClient, CodegenApiError
 from codegen_client.models.agents import AgentRun, AgentRunResponse
 from codegen_client.models.multi_run import MultiRunRequest, MultiRunResponse
+from backend.client_registry import ClientRegistry
+from backend.log_stream import LogStreamHub, parse_last_event_id
 from backend.multi_run_processor import MultiRunProcessor
+from backend.route_executor import RouteExecutor, RouteOverloadedError
 from backend.websocket_manager import connection_manager, multi_run_status_manager
 
 # Configure logging
@@ -31,11 +34,63 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Maximum number of tenant clients kept open at once
+MAX_CLIENTS = int(os.environ.get("CODEGEN_BACKEND_MAX_CLIENTS", "64"))
+
+# Token required by the admin endpoints (admin endpoints are open if unset)
+ADMIN_TOKEN = os.environ.get("CODEGEN_ADMIN_TOKEN")
+
+# Worker threads for blocking client calls
+MAX_WORKERS = int(os.environ.get("CODEGEN_BACKEND_MAX_WORKERS", "32"))
+
+# Concurrent requests per route, and requests allowed to wait beyond that
+ROUTE_CONCURRENCY = int(os.environ.get("CODEGEN_BACKEND_ROUTE_CONCURRENCY", "16"))
+ROUTE_QUEUE_DEPTH = int(os.environ.get("CODEGEN_BACKEND_ROUTE_QUEUE_DEPTH", "100"))
+
+# Logs fetched per upstream request, and seconds of silence before a heartbeat
+LOG_STREAM_PAGE_SIZE = 100
+LOG_STREAM_HEARTBEAT_INTERVAL = 15.0
+
+# Routes that need a different concurrency limit than ROUTE_CONCURRENCY
+ROUTE_CONCURRENCY_LIMITS = {
+    # Log streams stay open for the lifetime of a run but only hold a worker
+    # thread while polling
+    "stream_agent_run_logs": 256,
+    "generate_setup_commands": 4,
+    "analyze_sandbox_logs": 4,
+}
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Create shared resources on startup and release them on shutdown.
+    
+    Args:
+        app: FastAPI application
+    """
+    app.state.client_registry = ClientRegistry(max_clients=MAX_CLIENTS)
+    app.state.route_executor = RouteExecutor(
+        max_workers=MAX_WORKERS,
+        default_concurrency=ROUTE_CONCURRENCY,
+        max_queue_depth=ROUTE_QUEUE_DEPTH,
+        route_limits=ROUTE_CONCURRENCY_LIMITS,
+    )
+    app.state.log_stream_hub = LogStreamHub(page_size=LOG_STREAM_PAGE_SIZE)
+    logger.info(f"Client registry started (max_clients={MAX_CLIENTS})")
+    try:
+        yield
+    finally:
+        await app.state.log_stream_hub.close()
+        app.state.route_executor.shutdown()
+        app.state.client_registry.close()
+        logger.info("Client registry closed")
+
 # Create FastAPI app
 app = FastAPI(
     title="Enhanced Codegen UI API",
     description="API for the Enhanced Codegen UI",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -47,9 +102,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Thread pool for concurrent operations
-thread_pool = ThreadPoolExecutor(max_workers=10)
-
 # API key dependency
 async def get_api_key(api_key: str = Query(..., description="Codegen API key")):
     """
@@ -66,22 +118,101 @@ async def get_api_key(api_key: str = Query(..., description="Codegen API key")):
     return api_key
 
 # Client dependency
-async def get_client(api_key: str = Depends(get_api_key)):
+async def get_client(request: Request, api_key: str = Depends(get_api_key)):
     """
-    Get Codegen client.
+    Get the long-lived Codegen client for an API key.
+    
+    Clients are shared between requests through the client registry, so
+    connection pools and in-flight request coalescing are reused per tenant.
     
     Args:
+        request: Incoming request
         api_key: Codegen API key
         
-    Returns:
+    Yields:
         CodegenClient: Codegen client
     """
+    registry = request.app.state.client_registry
     try:
-        client = CodegenClient(api_key=api_key)
-        return client
+        client = registry.acquire(api_key)
     except Exception as e:
         logger.error(f"Error creating client: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error creating client: {str(e)}")
+    
+    try:
+        yield client
+    finally:
+        registry.release(client)
+
+# Executor dependency
+async def get_route_executor(request: Request):
+    """
+    Get the executor for blocking client calls and hold a slot for the route.
+    
+    Args:
+        request: Incoming request
+        
+    Yields:
+        RouteExecutor: Route executor
+    """
+    executor = request.app.state.route_executor
+    route = request.scope.get("route")
+    route_name = route.name if route is not None else request.url.path
+    try:
+        async with executor.slot(route_name):
+            yield executor
+    except RouteOverloadedError as e:
+        logger.warning(str(e))
+        raise HTTPException(status_code=503, detail=str(e))
+
+# Log stream hub dependency
+async def get_log_stream_hub(request: Request):
+    """
+    Get the hub that shares log pollers between streams.
+    
+    Args:
+        request: Incoming request
+        
+    Returns:
+        LogStreamHub: Log stream hub
+    """
+    return request.app.state.log_stream_hub
+
+def make_log_fetcher(client: CodegenClient, executor: RouteExecutor, org_id: int, agent_run_id: str):
+    """
+    Create a log fetcher for the log stream hub.
+    
+    Args:
+        client: Codegen client
+        executor: Executor for blocking client calls
+        org_id: Organization ID
+        agent_run_id: Agent run ID
+        
+    Returns:
+        Callable: Coroutine function taking ``(skip, limit)`` and returning a page of logs
+    """
+    async def fetch_logs(skip: int, limit: int):
+        """Fetch a page of logs after the cursor."""
+        return await executor.run(
+            client.agents_alpha.get_agent_run_logs,
+            org_id=org_id,
+            agent_run_id=agent_run_id,
+            skip=skip,
+            limit=limit,
+        )
+    
+    return fetch_logs
+
+# Admin dependency
+async def verify_admin_token(x_admin_token: Optional[str] = Header(None)):
+    """
+    Check the admin token when one is configured.
+    
+    Args:
+        x_admin_token: Value of the X-Admin-Token header
+    """
+    if ADMIN_TOKEN and not hmac.compare_digest(x_admin_token or "", ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
 
 # Models
 class AgentRunRequest(BaseModel):
@@ -168,22 +299,66 @@ async def health():
     """
     return {"status": "ok"}
 
+# Admin endpoints
+@app.get("/admin/clients", dependencies=[Depends(verify_admin_token)])
+async def get_client_metrics(request: Request):
+    """
+    Get metrics for the shared client registry.
+    
+    Tenants are identified by a prefix of the hash of their API key.
+    
+    Args:
+        request: Incoming request
+        
+    Returns:
+        dict: Registry counters and per-tenant client statistics
+    """
+    return request.app.state.client_registry.get_metrics()
+
+@app.get("/admin/routes", dependencies=[Depends(verify_admin_token)])
+async def get_route_metrics(request: Request):
+    """
+    Get metrics for the route executor.
+    
+    Args:
+        request: Incoming request
+        
+    Returns:
+        dict: Worker pool usage and per-route concurrency and queue depths
+    """
+    return request.app.state.route_executor.get_metrics()
+
+@app.get("/admin/log-streams", dependencies=[Depends(verify_admin_token)])
+async def get_log_stream_metrics(request: Request):
+    """
+    Get metrics for the log stream hub.
+    
+    Args:
+        request: Incoming request
+        
+    Returns:
+        dict: Watched runs, subscribers and upstream request counts
+    """
+    return request.app.state.log_stream_hub.get_metrics()
+
 # Users endpoints
 @app.get("/current-user")
 async def get_current_user(
     client: CodegenClient = Depends(get_client),
+    executor: RouteExecutor = Depends(get_route_executor),
 ):
     """
     Get current user information.
     
     Args:
         client: Codegen client
+        executor: Executor for blocking client calls
         
     Returns:
         dict: Current user information
     """
     try:
-        user = client.users.get_current_user()
+        user = await executor.run(client.users.get_current_user)
         return user.dict()
     except CodegenApiError as e:
         logger.error(f"Error getting current user: {str(e)}")
@@ -196,6 +371,7 @@ async def get_current_user(
 async def get_users(
     org_id: int = Path(..., description="Organization ID"),
     client: CodegenClient = Depends(get_client),
+    executor: RouteExecutor = Depends(get_route_executor),
     skip: int = Query(0, description="Number of items to skip"),
     limit: int = Query(100, description="Number of items to return"),
 ):
@@ -205,6 +381,7 @@ async def get_users(
     Args:
         org_id: Organization ID
         client: Codegen client
+        executor: Executor for blocking client calls
         skip: Number of items to skip
         limit: Number of items to return
         
@@ -212,7 +389,7 @@ async def get_users(
         dict: Users in the organization
     """
     try:
-        users = client.users.get_users(org_id=org_id, skip=skip, limit=limit)
+        users = await executor.run(client.users.get_users, org_id=org_id, skip=skip, limit=limit)
         return users.dict()
     except CodegenApiError as e:
         logger.error(f"Error getting users: {str(e)}")
@@ -226,6 +403,7 @@ async def get_user(
     org_id: int = Path(..., description="Organization ID"),
     user_id: int = Path(..., description="User ID"),
     client: CodegenClient = Depends(get_client),
+    executor: RouteExecutor = Depends(get_route_executor),
 ):
     """
     Get a specific user in an organization.
@@ -234,12 +412,13 @@ async def get_user(
         org_id: Organization ID
         user_id: User ID
         client: Codegen client
+        executor: Executor for blocking client calls
         
     Returns:
         dict: User information
     """
     try:
-        user = client.users.get_user(org_id=org_id, user_id=user_id)
+        user = await executor.run(client.users.get_user, org_id=org_id, user_id=user_id)
         return user.dict()
     except CodegenApiError as e:
         logger.error(f"Error getting user: {str(e)}")
@@ -252,6 +431,7 @@ async def get_user(
 @app.get("/organizations")
 async def get_organizations(
     client: CodegenClient = Depends(get_client),
+    executor: RouteExecutor = Depends(get_route_executor),
     skip: int = Query(0, description="Number of items to skip"),
     limit: int = Query(100, description="Number of items to return"),
 ):
@@ -260,6 +440,7 @@ async def get_organizations(
     
     Args:
         client: Codegen client
+        executor: Executor for blocking client calls
         skip: Number of items to skip
         limit: Number of items to return
         
@@ -267,7 +448,7 @@ async def get_organizations(
         dict: Organizations
     """
     try:
-        orgs = client.organizations.get_organizations(skip=skip, limit=limit)
+        orgs = await executor.run(client.organizations.get_organizations, skip=skip, limit=limit)
         return orgs.dict()
     except CodegenApiError as e:
         logger.error(f"Error getting organizations: {str(e)}")
@@ -281,6 +462,7 @@ async def get_organizations(
 async def get_repositories(
     org_id: int = Path(..., description="Organization ID"),
     client: CodegenClient = Depends(get_client),
+    executor: RouteExecutor = Depends(get_route_executor),
     skip: int = Query(0, description="Number of items to skip"),
     limit: int = Query(100, description="Number of items to return"),
 ):
@@ -290,6 +472,7 @@ async def get_repositories(
     Args:
         org_id: Organization ID
         client: Codegen client
+        executor: Executor for blocking client calls
         skip: Number of items to skip
         limit: Number of items to return
         
@@ -297,7 +480,7 @@ async def get_repositories(
         dict: Repositories
     """
     try:
-        repos = client.repositories.get_repositories(org_id=org_id, skip=skip, limit=limit)
+        repos = await executor.run(client.repositories.get_repositories, org_id=org_id, skip=skip, limit=limit)
         return repos.dict()
     except CodegenApiError as e:
         logger.error(f"Error getting repositories: {str(e)}")
@@ -311,6 +494,7 @@ async def get_repositories(
 async def get_integrations(
     org_id: int = Path(..., description="Organization ID"),
     client: CodegenClient = Depends(get_client),
+    executor: RouteExecutor = Depends(get_route_executor),
 ):
     """
     Get organization integrations.
@@ -318,12 +502,13 @@ async def get_integrations(
     Args:
         org_id: Organization ID
         client: Codegen client
+        executor: Executor for blocking client calls
         
     Returns:
         dict: Organization integrations
     """
     try:
-        integrations = client.integrations.get_integrations(org_id=org_id)
+        integrations = await executor.run(client.integrations.get_integrations, org_id=org_id)
         return integrations.dict()
     except CodegenApiError as e:
         logger.error(f"Error getting integrations: {str(e)}")
@@ -337,6 +522,7 @@ async def get_integrations(
 async def generate_setup_commands(
     request: SetupCommandsRequest,
     client: CodegenClient = Depends(get_client),
+    executor: RouteExecutor = Depends(get_route_executor),
 ):
     """
     Generate setup commands.
@@ -344,12 +530,14 @@ async def generate_setup_commands(
     Args:
         request: Setup commands request
         client: Codegen client
+        executor: Executor for blocking client calls
         
     Returns:
         dict: Generated setup commands
     """
     try:
-        commands = client.setup_commands.generate_setup_commands(
+        commands = await executor.run(
+            client.setup_commands.generate_setup_commands,
             repo_id=request.repo_id,
             language=request.language,
             framework=request.framework,
@@ -368,6 +556,7 @@ async def generate_setup_commands(
 async def analyze_sandbox_logs(
     request: AnalyzeSandboxLogsRequest,
     client: CodegenClient = Depends(get_client),
+    executor: RouteExecutor = Depends(get_route_executor),
 ):
     """
     Analyze sandbox logs.
@@ -375,12 +564,14 @@ async def analyze_sandbox_logs(
     Args:
         request: Analyze sandbox logs request
         client: Codegen client
+        executor: Executor for blocking client calls
         
     Returns:
         dict: Analysis results
     """
     try:
-        analysis = client.sandbox.analyze_logs(
+        analysis = await executor.run(
+            client.sandbox.analyze_logs,
             logs=request.logs,
             context=request.context,
         )
@@ -397,6 +588,7 @@ async def analyze_sandbox_logs(
 async def get_agent_runs(
     org_id: int = Path(..., description="Organization ID"),
     client: CodegenClient = Depends(get_client),
+    executor: RouteExecutor = Depends(get_route_executor),
     skip: int = Query(0, description="Number of items to skip"),
     limit: int = Query(100, description="Number of items to return"),
     user_id: Optional[int] = Query(None, description="Filter by user ID"),
@@ -407,6 +599,7 @@ async def get_agent_runs(
     Args:
         org_id: Organization ID
         client: Codegen client
+        executor: Executor for blocking client calls
         skip: Number of items to skip
         limit: Number of items to return
         user_id: Filter by user ID
@@ -415,7 +608,8 @@ async def get_agent_runs(
         dict: Agent runs
     """
     try:
-        runs = client.agents.list_agent_runs(
+        runs = await executor.run(
+            client.agents.list_agent_runs,
             org_id=org_id, 
             skip=skip, 
             limit=limit,
@@ -434,6 +628,7 @@ async def get_agent_run(
     org_id: int = Path(..., description="Organization ID"),
     agent_run_id: str = Path(..., description="Agent run ID"),
     client: CodegenClient = Depends(get_client),
+    executor: RouteExecutor = Depends(get_route_executor),
 ):
     """
     Get agent run.
@@ -442,12 +637,13 @@ async def get_agent_run(
         org_id: Organization ID
         agent_run_id: Agent run ID
         client: Codegen client
+        executor: Executor for blocking client calls
         
     Returns:
         dict: Agent run
     """
     try:
-        run = client.agents.get_agent_run(org_id=org_id, agent_run_id=agent_run_id)
+        run = await executor.run(client.agents.get_agent_run, org_id=org_id, agent_run_id=agent_run_id)
         return run.dict()
     except CodegenApiError as e:
         logger.error(f"Error getting agent run: {str(e)}")
@@ -461,6 +657,7 @@ async def create_agent_run(
     request: AgentRunRequest,
     org_id: int = Path(..., description="Organization ID"),
     client: CodegenClient = Depends(get_client),
+    executor: RouteExecutor = Depends(get_route_executor),
 ):
     """
     Create agent run.
@@ -469,6 +666,7 @@ async def create_agent_run(
         request: Agent run request
         org_id: Organization ID
         client: Codegen client
+        executor: Executor for blocking client calls
         
     Returns:
         dict: Created agent run
@@ -488,7 +686,7 @@ async def create_agent_run(
         if request.metadata is not None:
             data["metadata"] = request.metadata
             
-        run = client.agents.create_agent_run(org_id=org_id, **data)
+        run = await executor.run(client.agents.create_agent_run, org_id=org_id, **data)
         return run.dict()
     except CodegenApiError as e:
         logger.error(f"Error creating agent run: {str(e)}")
@@ -502,6 +700,7 @@ async def resume_agent_run(
     org_id: int = Path(..., description="Organization ID"),
     agent_run_id: str = Path(..., description="Agent run ID"),
     client: CodegenClient = Depends(get_client),
+    executor: RouteExecutor = Depends(get_route_executor),
 ):
     """
     Resume agent run.
@@ -510,12 +709,13 @@ async def resume_agent_run(
         org_id: Organization ID
         agent_run_id: Agent run ID
         client: Codegen client
+        executor: Executor for blocking client calls
         
     Returns:
         dict: Resumed agent run
     """
     try:
-        run = client.agents.resume_agent_run(org_id=org_id, agent_run_id=agent_run_id)
+        run = await executor.run(client.agents.resume_agent_run, org_id=org_id, agent_run_id=agent_run_id)
         return run.dict()
     except CodegenApiError as e:
         logger.error(f"Error resuming agent run: {str(e)}")
@@ -530,6 +730,7 @@ async def ban_all_checks_for_agent_run(
     agent_run_id: str = Path(..., description="Agent run ID"),
     request: BanChecksRequest = Body(...),
     client: CodegenClient = Depends(get_client),
+    executor: RouteExecutor = Depends(get_route_executor),
 ):
     """
     Ban all checks for agent run.
@@ -539,12 +740,14 @@ async def ban_all_checks_for_agent_run(
         agent_run_id: Agent run ID
         request: Ban checks request
         client: Codegen client
+        executor: Executor for blocking client calls
         
     Returns:
         dict: Result of banning checks
     """
     try:
-        result = client.agents.ban_all_checks_for_agent_run(
+        result = await executor.run(
+            client.agents.ban_all_checks_for_agent_run,
             org_id=org_id, 
             agent_run_id=agent_run_id,
             reason=request.reason
@@ -562,6 +765,7 @@ async def unban_all_checks_for_agent_run(
     org_id: int = Path(..., description="Organization ID"),
     agent_run_id: str = Path(..., description="Agent run ID"),
     client: CodegenClient = Depends(get_client),
+    executor: RouteExecutor = Depends(get_route_executor),
 ):
     """
     Unban all checks for agent run.
@@ -570,12 +774,14 @@ async def unban_all_checks_for_agent_run(
         org_id: Organization ID
         agent_run_id: Agent run ID
         client: Codegen client
+        executor: Executor for blocking client calls
         
     Returns:
         dict: Result of unbanning checks
     """
     try:
-        result = client.agents.unban_all_checks_for_agent_run(
+        result = await executor.run(
+            client.agents.unban_all_checks_for_agent_run,
             org_id=org_id, 
             agent_run_id=agent_run_id
         )
@@ -593,6 +799,7 @@ async def remove_codegen_from_pr(
     agent_run_id: str = Path(..., description="Agent run ID"),
     request: RemoveCodegenRequest = Body(...),
     client: CodegenClient = Depends(get_client),
+    executor: RouteExecutor = Depends(get_route_executor),
 ):
     """
     Remove Codegen from PR.
@@ -602,12 +809,14 @@ async def remove_codegen_from_pr(
         agent_run_id: Agent run ID
         request: Remove Codegen request
         client: Codegen client
+        executor: Executor for blocking client calls
         
     Returns:
         dict: Result of removing Codegen
     """
     try:
-        result = client.agents.remove_codegen_from_pr(
+        result = await executor.run(
+            client.agents.remove_codegen_from_pr,
             org_id=org_id, 
             agent_run_id=agent_run_id,
             pr_number=request.pr_number,
@@ -626,6 +835,7 @@ async def get_agent_run_logs(
     org_id: int = Path(..., description="Organization ID"),
     agent_run_id: str = Path(..., description="Agent run ID"),
     client: CodegenClient = Depends(get_client),
+    executor: RouteExecutor = Depends(get_route_executor),
     skip: int = Query(0, description="Number of items to skip"),
     limit: int = Query(100, description="Number of items to return"),
 ):
@@ -636,6 +846,7 @@ async def get_agent_run_logs(
         org_id: Organization ID
         agent_run_id: Agent run ID
         client: Codegen client
+        executor: Executor for blocking client calls
         skip: Number of items to skip
         limit: Number of items to return
         
@@ -643,7 +854,8 @@ async def get_agent_run_logs(
         dict: Agent run logs
     """
     try:
-        logs = client.agents.get_agent_run_logs(
+        logs = await executor.run(
+            client.agents_alpha.get_agent_run_logs,
             org_id=org_id, 
             agent_run_id=agent_run_id,
             skip=skip,
@@ -662,76 +874,130 @@ async def stream_agent_run_logs(
     org_id: int = Path(..., description="Organization ID"),
     agent_run_id: str = Path(..., description="Agent run ID"),
     client: CodegenClient = Depends(get_client),
+    executor: RouteExecutor = Depends(get_route_executor),
+    hub: LogStreamHub = Depends(get_log_stream_hub),
     poll_interval: float = Query(2.0, description="Polling interval in seconds"),
+    cursor: int = Query(0, ge=0, description="Index of the first log to stream"),
+    last_event_id: Optional[str] = Header(None, description="ID of the last event received before reconnecting"),
 ):
     """
     Stream agent run logs.
     
+    Logs are sent as Server-Sent Events whose ID is the log index. Streams
+    of the same run share one upstream poller, and a reconnecting client
+    resumes after the log named in its ``Last-Event-ID`` header.
+    
     Args:
         org_id: Organization ID
         agent_run_id: Agent run ID
         client: Codegen client
+        executor: Executor for blocking client calls
+        hub: Hub that shares log pollers between streams
         poll_interval: Polling interval in seconds
+        cursor: Index of the first log to stream
+        last_event_id: ID of the last event received before reconnecting
         
     Returns:
         StreamingResponse: Streaming response with agent run logs
     """
-    async def log_generator():
-        """Generate log events."""
-        last_log_id = None
-        run_complete = False
-        
-        while not run_complete:
-            try:
-                # Get agent run status
-                run = client.agents.get_agent_run(org_id=org_id, agent_run_id=agent_run_id)
-                
-                # Check if run is complete
-                if run.status in ["completed", "failed", "cancelled"]:
-                    run_complete = True
-                
-                # Get logs since last log
-                logs_response = client.agents.get_agent_run_logs(
-                    org_id=org_id,
-                    agent_run_id=agent_run_id,
-                    limit=100,
-                )
-                
-                logs = logs_response.logs
-                
-                # Filter logs since last log
-                if last_log_id and logs:
-                    for i, log in enumerate(logs):
-                        if log.id == last_log_id:
-                            logs = logs[i+1:]
-                            break
-                
-                # Update last log ID
-                if logs:
-                    last_log_id = logs[-1].id
-                
-                # Yield logs
-                for log in logs:
-                    yield f"data: {log.json()}\n\n"
-                
-                # If run is complete, yield end event
-                if run_complete:
-                    yield f"data: {{'event': 'end', 'status': '{run.status}'}}\n\n"
-                    break
-                
-                # Wait for next poll
-                await asyncio.sleep(poll_interval)
-                
-            except Exception as e:
-                logger.error(f"Error streaming logs: {str(e)}")
-                yield f"data: {{'event': 'error', 'message': '{str(e)}'}}\n\n"
-                break
+    last_index = parse_last_event_id(last_event_id)
+    if last_index is not None:
+        cursor = last_index + 1
     
     return StreamingResponse(
-        log_generator(),
+        hub.stream(
+            org_id,
+            agent_run_id,
+            make_log_fetcher(client, executor, org_id, agent_run_id),
+            cursor=cursor,
+            poll_interval=poll_interval,
+            heartbeat_interval=LOG_STREAM_HEARTBEAT_INTERVAL,
+        ),
         media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
+@app.websocket("/ws/organizations/{org_id}/agent/run/{agent_run_id}/logs")
+async def agent_run_logs_websocket(
+    websocket: WebSocket,
+    org_id: int,
+    agent_run_id: str,
+    api_key: str = Query(..., description="Codegen API key"),
+    cursor: int = Query(0, ge=0, description="Index of the first log to send"),
+):
+    """
+    Send agent run logs over a WebSocket.
+    
+    The connection joins the ``agent_run_logs_{org_id}_{agent_run_id}`` group
+    of the connection manager and shares the run's upstream poller with
+    every other stream of the same run.
+    
+    Args:
+        websocket: WebSocket connection
+        org_id: Organization ID
+        agent_run_id: Agent run ID
+        api_key: Codegen API key
+        cursor: Index of the first log to send
+    """
+    registry = websocket.app.state.client_registry
+    executor = websocket.app.state.route_executor
+    hub = websocket.app.state.log_stream_hub
+    
+    client = registry.acquire(api_key)
+    connection_id = await connection_manager.connect(websocket)
+    connection_manager.add_to_group(connection_id, f"agent_run_logs_{org_id}_{agent_run_id}")
+    subscription = None
+    try:
+        subscription = await hub.subscribe(
+            org_id,
+            agent_run_id,
+            make_log_fetcher(client, executor, org_id, agent_run_id),
+            cursor=cursor,
+        )
+        while True:
+            event = await subscription.get(timeout=LOG_STREAM_HEARTBEAT_INTERVAL)
+            if event is None:
+                await connection_manager.send_personal_message({"type": "heartbeat"}, connection_id)
+                continue
+            
+            event_id, data, final = event
+            await connection_manager.send_personal_message(
+                {
+                    "type": "agent_run_log",
+                    "agent_run_id": agent_run_id,
+                    "id": event_id,
+                    "data": data,
+                },
+                connection_id,
+            )
+            if final:
+                break
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logger.error(f"Error streaming logs over WebSocket: {str(e)}")
+        try:
+            await connection_manager.send_personal_message(
+                {
+                    "type": "agent_run_log",
+                    "agent_run_id": agent_run_id,
+                    "id": None,
+                    "data": {"event": "error", "message": str(e)},
+                },
+                connection_id,
+            )
+        except Exception:
+            pass
+    finally:
+        if subscription is not None:
+            hub.unsubscribe(subscription)
+        connection_manager.disconnect(connection_id)
+        registry.release(client)
+        try:
+            await websocket.close()
+        except Exception:
+            pass
+
 # Multi-run agent
 @app.post("/organizations/{org_id}/multi-run")
 async def create_multi_run(
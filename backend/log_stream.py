@@ -0,0 +1,459 @@
+"""
+Agent run log streaming for the Enhanced Codegen UI backend.
+
+This module formats Server-Sent Events and shares one incremental upstream
+poller per agent run between every client watching that run.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from codegen_client.models.agents import AgentRunResponse
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+# Agent run statuses after which no more logs are produced
+TERMINAL_STATUSES = {"COMPLETED", "FAILED", "CANCELLED"}
+
+
+def is_terminal_status(status: Optional[str]) -> bool:
+    """
+    Check whether an agent run status is final.
+
+    Args:
+        status: Agent run status
+
+    Returns:
+        bool: True if the run has finished
+    """
+    return bool(status) and status.upper() in TERMINAL_STATUSES
+
+
+def format_sse_event(
+    data: Any,
+    event_id: Optional[int] = None,
+    event: Optional[str] = None,
+    retry_ms: Optional[int] = None,
+) -> str:
+    """
+    Format a Server-Sent Event.
+
+    Args:
+        data: Event payload, serialized as JSON
+        event_id: Event ID, echoed back by clients in ``Last-Event-ID``
+        event: Event type (defaults to ``message``)
+        retry_ms: Reconnection delay hint for the client
+
+    Returns:
+        str: Encoded event
+    """
+    lines = []
+    if retry_ms is not None:
+        lines.append(f"retry: {retry_ms}")
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    if event is not None:
+        lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, default=str)}")
+    return "\n".join(lines) + "\n\n"
+
+
+def format_sse_comment(comment: str) -> str:
+    """
+    Format a Server-Sent Events comment, used as a heartbeat.
+
+    Args:
+        comment: Comment text
+
+    Returns:
+        str: Encoded comment
+    """
+    return f": {comment}\n\n"
+
+
+def parse_last_event_id(value: Optional[str]) -> Optional[int]:
+    """
+    Parse a ``Last-Event-ID`` header into a log index.
+
+    Args:
+        value: Header value
+
+    Returns:
+        Optional[int]: Index of the last log the client received, or None if
+            the header is missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        index = int(value)
+    except ValueError:
+        return None
+    return index if index >= 0 else None
+
+
+
+
+# Coroutine function taking ``(skip, limit)`` and returning a page of logs
+LogFetcher = Callable[[int, int], Awaitable[AgentRunResponse]]
+
+# Log index (None for control events), event payload, and whether it is the last event
+LogEvent = Tuple[Optional[int], Dict[str, Any], bool]
+
+
+class LogSubscription:
+    """
+    A single client's subscription to the logs of an agent run.
+
+    Events are queued by the ``LogStreamHub`` and read with ``get``.
+    """
+
+    def __init__(self, key: Tuple[int, str], fetch_logs: LogFetcher, cursor: int):
+        """
+        Initialize the subscription.
+
+        Args:
+            key: Organization ID and agent run ID
+            fetch_logs: Log fetcher using the subscriber's own client
+            cursor: Index of the next log to deliver
+        """
+        self.key = key
+        self.fetch_logs = fetch_logs
+        self.cursor = cursor
+        self._queue: "asyncio.Queue[LogEvent]" = asyncio.Queue()
+
+    def _deliver(self, index: int, data: Dict[str, Any]):
+        """
+        Queue a log unless the subscriber has already received it.
+
+        Args:
+            index: Log index
+            data: Log payload
+        """
+        if index < self.cursor:
+            return
+        self.cursor = index + 1
+        self._queue.put_nowait((index, data, False))
+
+    def _finish(self, data: Dict[str, Any]):
+        """
+        Queue the final event of the subscription.
+
+        Args:
+            data: End or error payload
+        """
+        self._queue.put_nowait((None, data, True))
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[LogEvent]:
+        """
+        Wait for the next event.
+
+        Args:
+            timeout: Seconds to wait before giving up
+
+        Returns:
+            Optional[LogEvent]: Next event, or None if the timeout expired
+        """
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class _RunWatch:
+    """Upstream poller state for one watched agent run."""
+
+    def __init__(self, cursor: int, poll_interval: float):
+        # Index of the first buffered log and of the next log to fetch
+        self.base = cursor
+        self.cursor = cursor
+        self.poll_interval = poll_interval
+        self.logs: List[Dict[str, Any]] = []
+        self.subscribers: List[LogSubscription] = []
+        self.task: Optional["asyncio.Task[None]"] = None
+
+
+class LogStreamHub:
+    """
+    Hub that shares one upstream log poller per agent run.
+
+    Runs are keyed by ``(org_id, agent_run_id)``. The first subscriber to a
+    run starts a poller that fetches new logs incrementally and fans each
+    one out to every subscriber; the poller stops when the last subscriber
+    leaves, so upstream traffic scales with the number of watched runs
+    rather than the number of viewers.
+
+    Logs fetched by a poller are buffered for as long as the run is watched,
+    so later subscribers replay them without another upstream request.
+    Polls use the fetcher of the oldest remaining subscriber, and each new
+    subscriber's own fetcher is called once on join so that only clients
+    with access to the run can read the shared buffer.
+    """
+
+    def __init__(self, poll_interval: float = 2.0, page_size: int = 100):
+        """
+        Initialize the hub.
+
+        Args:
+            poll_interval: Default seconds between polls of a run
+            page_size: Maximum number of logs fetched per request
+        """
+        self.poll_interval = poll_interval
+        self.page_size = page_size
+        self._watches: Dict[Tuple[int, str], _RunWatch] = {}
+        self._fetches = 0
+        self._logs_fetched = 0
+        self._subscriptions = 0
+
+    async def _fetch(self, fetch_logs: LogFetcher, skip: int, limit: int) -> AgentRunResponse:
+        """
+        Fetch a page of logs and count the upstream request.
+
+        Args:
+            fetch_logs: Log fetcher
+            skip: Index of the first log
+            limit: Maximum number of logs
+
+        Returns:
+            AgentRunResponse: Page of logs with the run status
+        """
+        self._fetches += 1
+        response = await fetch_logs(skip, limit)
+        self._logs_fetched += len(response.logs)
+        return response
+
+    async def subscribe(
+        self,
+        org_id: int,
+        agent_run_id: str,
+        fetch_logs: LogFetcher,
+        cursor: int = 0,
+        poll_interval: Optional[float] = None,
+    ) -> LogSubscription:
+        """
+        Subscribe to the logs of an agent run, starting at ``cursor``.
+
+        Every call must be paired with ``unsubscribe``.
+
+        Args:
+            org_id: Organization ID
+            agent_run_id: Agent run ID
+            fetch_logs: Log fetcher using the subscriber's own client
+            cursor: Index of the first log to deliver
+            poll_interval: Seconds between polls if this starts a new poller
+
+        Returns:
+            LogSubscription: Subscription receiving the run's logs
+
+        Raises:
+            Exception: If the subscriber cannot fetch the run's logs
+        """
+        key = (org_id, agent_run_id)
+        subscription = LogSubscription(key, fetch_logs, cursor)
+
+        watch = self._watches.get(key)
+        if watch is not None:
+            # Fetch logs from before the shared buffer with the subscriber's
+            # own client, which also confirms it can read the run
+            end = max(watch.base, subscription.cursor + 1)
+            while watch is not None and subscription.cursor < end:
+                response = await self._fetch(
+                    fetch_logs, subscription.cursor, min(self.page_size, end - subscription.cursor)
+                )
+                if not response.logs:
+                    break
+                for log in response.logs:
+                    subscription._deliver(subscription.cursor, self._log_data(log, subscription.cursor))
+                watch = self._watches.get(key)
+                if watch is not None:
+                    end = watch.base
+
+        # Nothing is awaited from here on, so no log can be published between
+        # replaying the buffer and joining the subscriber list
+        if watch is None:
+            watch = _RunWatch(subscription.cursor, poll_interval or self.poll_interval)
+            self._watches[key] = watch
+            watch.subscribers.append(subscription)
+            watch.task = asyncio.create_task(self._poll(key, watch))
+        else:
+            start = max(subscription.cursor - watch.base, 0)
+            for offset, data in enumerate(watch.logs[start:], start):
+                subscription._deliver(watch.base + offset, data)
+            watch.subscribers.append(subscription)
+
+        self._subscriptions += 1
+        return subscription
+
+    def unsubscribe(self, subscription: LogSubscription):
+        """
+        Remove a subscription, stopping the run's poller if it was the last one.
+
+        Args:
+            subscription: Subscription returned by ``subscribe``
+        """
+        watch = self._watches.get(subscription.key)
+        if watch is None or subscription not in watch.subscribers:
+            return
+        watch.subscribers.remove(subscription)
+        if not watch.subscribers:
+            del self._watches[subscription.key]
+            if watch.task is not None:
+                watch.task.cancel()
+
+    @staticmethod
+    def _log_data(log: Any, index: int) -> Dict[str, Any]:
+        """
+        Convert a log entry to an event payload.
+
+        Args:
+            log: Log entry
+            index: Log index
+
+        Returns:
+            Dict[str, Any]: Log payload including its index
+        """
+        data = log.dict()
+        data["id"] = index
+        return data
+
+    def _finish(self, key: Tuple[int, str], watch: _RunWatch, data: Dict[str, Any]):
+        """
+        Send a final event to every subscriber and forget the run.
+
+        Args:
+            key: Organization ID and agent run ID
+            watch: Watched run
+            data: End or error payload
+        """
+        if self._watches.get(key) is watch:
+            del self._watches[key]
+        for subscription in watch.subscribers:
+            subscription._finish(data)
+        watch.subscribers = []
+
+    async def _poll(self, key: Tuple[int, str], watch: _RunWatch):
+        """
+        Poll a run for new logs until it finishes or loses its subscribers.
+
+        Args:
+            key: Organization ID and agent run ID
+            watch: Watched run
+        """
+        try:
+            while watch.subscribers:
+                # Drain every page of logs available past the cursor
+                while True:
+                    fetch_logs = watch.subscribers[0].fetch_logs
+                    response = await self._fetch(fetch_logs, watch.cursor, self.page_size)
+                    for log in response.logs:
+                        data = self._log_data(log, watch.cursor)
+                        watch.logs.append(data)
+                        for subscription in watch.subscribers:
+                            subscription._deliver(watch.cursor, data)
+                        watch.cursor += 1
+                    if len(response.logs) < self.page_size or not watch.subscribers:
+                        break
+
+                if is_terminal_status(response.status):
+                    self._finish(
+                        key,
+                        watch,
+                        {"event": "end", "status": response.status, "total_logs": watch.cursor},
+                    )
+                    return
+
+                await asyncio.sleep(watch.poll_interval)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error polling logs for agent run {key[1]}: {str(e)}")
+            self._finish(key, watch, {"event": "error", "message": str(e)})
+
+    async def stream(
+        self,
+        org_id: int,
+        agent_run_id: str,
+        fetch_logs: LogFetcher,
+        cursor: int = 0,
+        poll_interval: Optional[float] = None,
+        heartbeat_interval: float = 15.0,
+    ) -> AsyncIterator[str]:
+        """
+        Stream the logs of an agent run as Server-Sent Events.
+
+        Each log is sent with its index as the event ID, and a heartbeat
+        comment is sent when nothing has been written for
+        ``heartbeat_interval`` seconds.
+
+        Args:
+            org_id: Organization ID
+            agent_run_id: Agent run ID
+            fetch_logs: Log fetcher using the subscriber's own client
+            cursor: Index of the first log to send
+            poll_interval: Seconds between polls if this starts a new poller
+            heartbeat_interval: Seconds of silence before a heartbeat is sent
+
+        Yields:
+            str: Encoded events
+        """
+        try:
+            subscription = await self.subscribe(
+                org_id, agent_run_id, fetch_logs, cursor=cursor, poll_interval=poll_interval
+            )
+        except Exception as e:
+            logger.error(f"Error streaming logs: {str(e)}")
+            yield format_sse_event({"event": "error", "message": str(e)})
+            return
+
+        retry_ms: Optional[int] = int((poll_interval or self.poll_interval) * 1000)
+        try:
+            while True:
+                event = await subscription.get(timeout=heartbeat_interval)
+                if event is None:
+                    yield format_sse_comment("heartbeat")
+                    continue
+
+                event_id, data, final = event
+                yield format_sse_event(data, event_id=event_id, retry_ms=retry_ms)
+                retry_ms = None
+                if final:
+                    return
+        finally:
+            self.unsubscribe(subscription)
+
+    async def close(self):
+        """
+        Stop every poller.
+        """
+        watches = list(self._watches.values())
+        self._watches.clear()
+        for watch in watches:
+            if watch.task is not None:
+                watch.task.cancel()
+        for watch in watches:
+            if watch.task is not None:
+                try:
+                    await watch.task
+                except asyncio.CancelledError:
+                    pass
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get hub metrics.
+
+        Returns:
+            Dict[str, Any]: Watched runs, subscribers and upstream request counts
+        """
+        return {
+            "watched_runs": len(self._watches),
+            "subscribers": sum(len(watch.subscribers) for watch in self._watches.values()),
+            "total_subscriptions": self._subscriptions,
+            "upstream_fetches": self._fetches,
+            "logs_fetched": self._logs_fetched,
+        }
@@ -9,8 +9,9 @@ import asyncio
 import logging
 import time
 import threading
+import uuid
 from concurrent.futures import ThreadPoolExecutor
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, Callable
 
 from codegen_client import CodegenClient, CodegenApiError
 from codegen_client.models.agents import AgentRun
@@ -0,0 +1,232 @@
+"""
+Route executor for the Enhanced Codegen UI backend.
+
+This module runs blocking Codegen client calls off the event loop and limits
+how many requests each route handles at once.
+"""
+
+import asyncio
+import functools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+class RouteOverloadedError(Exception):
+    """
+    Raised when a route's queue of waiting requests is full.
+    """
+
+    def __init__(self, route: str):
+        self.route = route
+        super().__init__(f"Too many pending requests for route {route}")
+
+
+class _RouteState:
+    """Concurrency limit and counters for a single route."""
+
+    def __init__(self, limit: int, max_queue_depth: int):
+        self.limit = limit
+        self.max_queue_depth = max_queue_depth
+        self.semaphore = asyncio.Semaphore(limit)
+        self.in_flight = 0
+        self.waiting = 0
+        self.peak_waiting = 0
+        self.completed = 0
+        self.rejected = 0
+        self.total_wait_seconds = 0.0
+
+
+class RouteExecutor:
+    """
+    Executor for blocking calls made by backend routes.
+
+    Blocking client calls run on a bounded thread pool so a slow upstream
+    request never stalls the event loop. Each route also gets its own
+    concurrency limit; requests beyond the limit wait in a bounded queue and
+    are rejected once that queue is full.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 32,
+        default_concurrency: int = 16,
+        max_queue_depth: int = 100,
+        route_limits: Optional[Dict[str, int]] = None,
+    ):
+        """
+        Initialize the route executor.
+
+        Args:
+            max_workers: Number of worker threads for blocking calls
+            default_concurrency: Concurrent requests allowed per route
+            max_queue_depth: Requests allowed to wait for a slot per route
+            route_limits: Concurrency limits for specific routes
+        """
+        self.max_workers = max_workers
+        self.default_concurrency = default_concurrency
+        self.max_queue_depth = max_queue_depth
+        self.route_limits = route_limits or {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="codegen-route"
+        )
+        self._routes: Dict[str, _RouteState] = {}
+
+        # Executor counters are updated from worker threads
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._calls = 0
+        self._errors = 0
+        self._total_run_seconds = 0.0
+
+    def _get_route(self, route: str) -> _RouteState:
+        """
+        Get the state for a route, creating it on first use.
+
+        Args:
+            route: Route name
+
+        Returns:
+            _RouteState: Route state
+        """
+        state = self._routes.get(route)
+        if state is None:
+            limit = self.route_limits.get(route, self.default_concurrency)
+            state = _RouteState(limit, self.max_queue_depth)
+            self._routes[route] = state
+        return state
+
+    @asynccontextmanager
+    async def slot(self, route: str) -> AsyncIterator[None]:
+        """
+        Hold one of a route's concurrency slots.
+
+        Args:
+            route: Route name
+
+        Raises:
+            RouteOverloadedError: If the route's wait queue is full
+        """
+        state = self._get_route(route)
+        if state.semaphore.locked() and state.waiting >= state.max_queue_depth:
+            state.rejected += 1
+            raise RouteOverloadedError(route)
+
+        state.waiting += 1
+        state.peak_waiting = max(state.peak_waiting, state.waiting)
+        start_time = time.monotonic()
+        try:
+            await state.semaphore.acquire()
+        finally:
+            state.waiting -= 1
+        state.total_wait_seconds += time.monotonic() - start_time
+
+        state.in_flight += 1
+        try:
+            yield
+        finally:
+            state.in_flight -= 1
+            state.completed += 1
+            state.semaphore.release()
+
+    def _call(self, func: Callable[[], Any]) -> Any:
+        """
+        Run a blocking call on a worker thread and record its timing.
+
+        Args:
+            func: Blocking call
+
+        Returns:
+            Any: Result of the call
+        """
+        with self._lock:
+            self._queued -= 1
+            self._active += 1
+        start_time = time.monotonic()
+        failed = False
+        try:
+            return func()
+        except Exception:
+            failed = True
+            raise
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._calls += 1
+                self._errors += failed
+                self._total_run_seconds += time.monotonic() - start_time
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run a blocking function on the executor without blocking the event loop.
+
+        Args:
+            func: Blocking function
+            *args: Positional arguments for the function
+            **kwargs: Keyword arguments for the function
+
+        Returns:
+            Any: Result of the function
+        """
+        with self._lock:
+            self._queued += 1
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self._call, functools.partial(func, *args, **kwargs)
+        )
+
+    def shutdown(self, wait: bool = False):
+        """
+        Shut down the worker threads.
+
+        Args:
+            wait: Whether to wait for running calls to finish
+        """
+        self._executor.shutdown(wait=wait)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get executor and per-route metrics.
+
+        Returns:
+            Dict[str, Any]: Worker pool usage and per-route queue depths
+        """
+        with self._lock:
+            executor_metrics = {
+                "max_workers": self.max_workers,
+                "queued": self._queued,
+                "active": self._active,
+                "calls": self._calls,
+                "errors": self._errors,
+                "average_run_seconds": (
+                    self._total_run_seconds / self._calls if self._calls else 0.0
+                ),
+            }
+
+        routes = {}
+        for route, state in self._routes.items():
+            admitted = state.completed + state.in_flight
+            routes[route] = {
+                "limit": state.limit,
+                "in_flight": state.in_flight,
+                "waiting": state.waiting,
+                "peak_waiting": state.peak_waiting,
+                "completed": state.completed,
+                "rejected": state.rejected,
+                "average_wait_seconds": (
+                    state.total_wait_seconds / admitted if admitted else 0.0
+                ),
+            }
+
+        return {"executor": executor_metrics, "routes": routes}
@@ -9,7 +9,7 @@ import uuid
 from typing import Dict, Any, Optional, List, Callable, Union
 
 from codegen.config.client_config import ClientConfig
-from codegen.utils.caching import ResponseCache
+from codegen.utils.caching import ResponseCache, CacheLookup
 from codegen.utils.metrics import MetricsTracker
 from codegen.utils.webhooks import WebhookHandler
 from codegen.exceptions.api_exceptions import (
@@ -45,6 +45,9 @@ class BaseCodegenClient:
         self.cache = ResponseCache(
             max_size=self.config.max_cache_size,
             ttl=self.config.cache_ttl,
+            eviction_policy=self.config.cache_eviction_policy,
+            max_bytes=self.config.max_cache_bytes,
+            stale_ttl=self.config.cache_stale_ttl,
         ) if self.config.use_cache else None
         
         # Set up metrics tracking
@@ -88,6 +91,26 @@ class BaseCodegenClient:
         except ImportError:
             return "0.1.0"
     
+    def _get_conditional_headers(self, cached: Optional[CacheLookup]) -> Dict[str, str]:
+        """Get revalidation headers for a cached response.
+        
+        Args:
+            cached: The cached response being revalidated, if any.
+            
+        Returns:
+            A dictionary with ``If-None-Match`` and/or ``If-Modified-Since`` headers.
+        """
+        headers = {}
+        if cached is None:
+            return headers
+        
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+        
+        return headers
+    
     def _validate_org_id(self, org_id: Union[int, str]) -> int:
         """Validate and convert organization ID.
         
@@ -40,6 +40,8 @@ from codegen.exceptions.api_exceptions import (
     NetworkError,
     BulkOperationError,
 )
+from codegen.utils.caching import CacheLookup, generate_request_key
+from codegen.utils.coalescing import SingleFlight
 from codegen.utils.logging import log_request, log_response
 
 # Configure logging
@@ -57,6 +59,16 @@ class CodegenClient(BaseCodegenClient):
         """
         super().__init__(config)
         self.session = requests.Session()
+        
+        # Background revalidation of stale cache entries
+        self._refresh_executor = (
+            ThreadPoolExecutor(max_workers=4, thread_name_prefix="codegen-cache-refresh")
+            if self.cache and self.config.cache_stale_while_revalidate
+            else None
+        )
+        
+        # Concurrent identical GETs share one upstream call
+        self._in_flight = SingleFlight() if self.config.coalesce_requests else None
         logger.debug("Initialized CodegenClient")
     
     def _make_request(
@@ -92,17 +104,86 @@ class CodegenClient(BaseCodegenClient):
         request_id = self._generate_request_id()
         
         # Check cache if enabled and applicable
-        cache_key = None
-        if use_cache and self.cache and method.upper() == "GET":
-            cache_key = self.cache._generate_key(method, endpoint, params, json)
-            cached_result = self.cache.get(method, endpoint, params, json)
-            if cached_result:
+        cached = None
+        use_cache = bool(use_cache and self.cache and method.upper() == "GET")
+        if use_cache:
+            cached = self.cache.lookup(method, endpoint, params, json)
+            if cached and (not cached.stale or self._refresh_executor):
+                # Serve stale entries immediately while one refresh runs
+                if cached.stale and self.cache.begin_refresh(method, endpoint, params, json):
+                    self._refresh_executor.submit(
+                        self._refresh_cached, method, endpoint, params, json, cached
+                    )
                 if self.metrics:
                     self.metrics.record_request(
                         method, endpoint, 0, 200, request_id, cached=True
                     )
-                return cached_result
+                return cached.value
+        
+        # Join an identical request that is already in flight
+        if self._in_flight is not None and method.upper() == "GET":
+            return self._in_flight.do(
+                generate_request_key(method, endpoint, params, json),
+                lambda: self._send_request(
+                    method, endpoint, params, json, request_id, use_cache, cached
+                ),
+            )
+        
+        return self._send_request(method, endpoint, params, json, request_id, use_cache, cached)
+    
+    def _refresh_cached(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        json: Optional[Dict[str, Any]],
+        cached: CacheLookup,
+    ) -> None:
+        """Revalidate a stale cache entry in the background.
         
+        Args:
+            method: HTTP method (GET, POST, etc.).
+            endpoint: API endpoint.
+            params: Query parameters.
+            json: JSON request body.
+            cached: The stale cache entry being refreshed.
+        """
+        try:
+            self._send_request(
+                method, endpoint, params, json, self._generate_request_id(), True, cached
+            )
+        except Exception as e:
+            logger.warning(f"Background refresh of {endpoint} failed: {e}")
+        finally:
+            self.cache.end_refresh(method, endpoint, params, json)
+    
+    def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        json: Optional[Dict[str, Any]],
+        request_id: str,
+        use_cache: bool = False,
+        cached: Optional[CacheLookup] = None,
+    ) -> Dict[str, Any]:
+        """Send a request to the API, bypassing cache lookups.
+        
+        When a cached entry is given, the request carries its validators and a
+        ``304 Not Modified`` response renews the entry without reading the body.
+        
+        Args:
+            method: HTTP method (GET, POST, etc.).
+            endpoint: API endpoint.
+            params: Query parameters.
+            json: JSON request body.
+            request_id: Request ID for tracking.
+            use_cache: Whether to store the response in the cache.
+            cached: Cached entry to revalidate, if any.
+            
+        Returns:
+            The response data as a dictionary.
+        """
         # Build URL
         url = f"{self.config.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
         
@@ -112,6 +193,9 @@ class CodegenClient(BaseCodegenClient):
         # Add request ID to headers for tracking
         headers["X-Request-ID"] = request_id
         
+        # Ask the server to confirm the cached copy instead of resending it
+        headers.update(self._get_conditional_headers(cached))
+        
         # Log the request if enabled
         if self.config.log_requests:
             log_request(logger, method, url, params, headers, json)
@@ -186,12 +270,25 @@ class CodegenClient(BaseCodegenClient):
                         request_id,
                     )
                 
+                # Renew the cached response if it has not changed
+                if response.status_code == 304 and cached is not None:
+                    renewed = self.cache.renew(method, endpoint, params, json)
+                    return renewed if renewed is not None else cached.value
+                
                 # Parse response
                 result = response.json()
                 
                 # Cache result if applicable
-                if cache_key and response.ok:
-                    self.cache.set(method, endpoint, result, params, json)
+                if use_cache and response.ok:
+                    self.cache.set(
+                        method,
+                        endpoint,
+                        result,
+                        params,
+                        json,
+                        etag=response.headers.get("ETag"),
+                        last_modified=response.headers.get("Last-Modified"),
+                    )
                 
                 return result
             
@@ -743,10 +840,18 @@ class CodegenClient(BaseCodegenClient):
                 "status_code_distribution": client_stats.status_code_distribution,
             }
         
+        if self.cache:
+            stats["cache"] = self.cache.get_stats()
+        
+        if self._in_flight is not None:
+            stats["coalescing"] = self._in_flight.get_stats()
+        
         return stats
     
     def close(self) -> None:
         """Close the client and release resources."""
+        if self._refresh_executor:
+            self._refresh_executor.shutdown(wait=False)
         self.session.close()
         super().close()
         logger.debug("Closed CodegenClient")
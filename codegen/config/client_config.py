@@ -36,6 +36,13 @@ class ClientConfig:
     use_cache: bool = True
     cache_ttl: int = 300  # 5 minutes
     max_cache_size: int = 100
+    cache_eviction_policy: str = "lru"  # "lru" or "lfu"
+    max_cache_bytes: Optional[int] = None
+    cache_stale_ttl: int = 0  # seconds an expired entry is kept for revalidation
+    cache_stale_while_revalidate: bool = False
+    
+    # Share one upstream call among concurrent identical GET requests
+    coalesce_requests: bool = True
     
     # Webhook settings
     webhook_secret: Optional[str] = None
@@ -87,6 +94,12 @@ class ClientConfig:
         
         if self.retry_backoff <= 0:
             raise ValueError("Retry backoff must be greater than 0")
+        
+        if self.cache_eviction_policy not in ("lru", "lfu"):
+            raise ValueError("Cache eviction policy must be 'lru' or 'lfu'")
+        
+        if self.cache_stale_ttl < 0:
+            raise ValueError("Cache stale TTL must be greater than or equal to 0")
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert the configuration to a dictionary."""
@@ -103,6 +116,11 @@ class ClientConfig:
             "use_cache": self.use_cache,
             "cache_ttl": self.cache_ttl,
             "max_cache_size": self.max_cache_size,
+            "cache_eviction_policy": self.cache_eviction_policy,
+            "max_cache_bytes": self.max_cache_bytes,
+            "cache_stale_ttl": self.cache_stale_ttl,
+            "cache_stale_while_revalidate": self.cache_stale_while_revalidate,
+            "coalesce_requests": self.coalesce_requests,
             "webhook_secret": "***" if self.webhook_secret else None,
             "headers": {k: v for k, v in self.headers.items() if k.lower() != "authorization"},
         }
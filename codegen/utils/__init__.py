@@ -4,7 +4,8 @@ Utilities for the Codegen API client.
 This package contains utility classes and functions used by the Codegen API client.
 """
 
-from codegen.utils.caching import ResponseCache
+from codegen.utils.caching import ResponseCache, CacheLookup, generate_request_key
+from codegen.utils.coalescing import SingleFlight, AsyncSingleFlight
 from codegen.utils.metrics import MetricsTracker
 from codegen.utils.webhooks import WebhookHandler
 from codegen.utils.logging import (
@@ -16,6 +17,10 @@ from codegen.utils.logging import (
 
 __all__ = [
     "ResponseCache",
+    "CacheLookup",
+    "generate_request_key",
+    "SingleFlight",
+    "AsyncSingleFlight",
     "MetricsTracker",
     "WebhookHandler",
     "configure_logging",
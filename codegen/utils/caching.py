@@ -5,121 +5,434 @@ This module contains classes for caching API responses.
 """
 
 import time
+import heapq
 import hashlib
 import json
-from typing import Dict, Any, Optional, Tuple
+import sys
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Tuple, NamedTuple, Set
 from threading import Lock
 
 
+def generate_request_key(method: str, endpoint: str, params: Optional[Dict] = None,
+                         json_data: Optional[Dict] = None) -> str:
+    """Generate a key identifying a request.
+
+    Args:
+        method: HTTP method (GET, POST, etc.).
+        endpoint: API endpoint.
+        params: Query parameters.
+        json_data: JSON request body.
+
+    Returns:
+        A hash of the method, endpoint, params and body.
+    """
+    key_parts = [method.upper(), endpoint]
+
+    if params:
+        # Sort params to ensure consistent keys
+        sorted_params = json.dumps(params, sort_keys=True)
+        key_parts.append(sorted_params)
+
+    if json_data:
+        # Sort json data to ensure consistent keys
+        sorted_json = json.dumps(json_data, sort_keys=True)
+        key_parts.append(sorted_json)
+
+    # Join parts and create a hash
+    key_string = ":".join(key_parts)
+    return hashlib.md5(key_string.encode()).hexdigest()
+
+
+class _CacheEntry:
+    """A cached value with its expiry time, size, access frequency and validators."""
+
+    __slots__ = ("value", "expires_at", "size", "frequency", "etag", "last_modified")
+
+    def __init__(
+        self,
+        value: Any,
+        expires_at: float,
+        size: int,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ):
+        self.value = value
+        self.expires_at = expires_at
+        self.size = size
+        self.frequency = 1
+        self.etag = etag
+        self.last_modified = last_modified
+
+
+class CacheLookup(NamedTuple):
+    """Result of a cache lookup that may return a stale entry."""
+
+    value: Any
+    stale: bool
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
 class ResponseCache:
-    """Simple in-memory cache for API responses."""
-    
-    def __init__(self, max_size: int = 100, ttl: int = 300):
+    """In-memory cache for API responses.
+
+    Entries are evicted in O(1) using either least-recently-used or
+    least-frequently-used order. Expired entries are dropped lazily on
+    lookup and through a heap ordered by expiry time, so no operation scans
+    the whole cache while holding the lock.
+
+    With a non-zero ``stale_ttl`` an entry is kept for that long after it
+    expires. ``lookup`` returns such entries marked as stale together with
+    their ``ETag``/``Last-Modified`` validators so callers can serve them
+    while revalidating, and ``renew`` makes them fresh again after a
+    ``304 Not Modified`` response.
+    """
+
+    EVICTION_POLICIES = ("lru", "lfu")
+
+    def __init__(
+        self,
+        max_size: int = 100,
+        ttl: int = 300,
+        eviction_policy: str = "lru",
+        max_bytes: Optional[int] = None,
+        stale_ttl: int = 0,
+    ):
         """Initialize the cache.
-        
+
         Args:
             max_size: Maximum number of items to store in the cache.
             ttl: Time-to-live in seconds for cached items.
+            eviction_policy: Eviction order when the cache is full, "lru" or "lfu".
+            max_bytes: Optional limit on the total estimated size of cached values.
+            stale_ttl: Seconds an expired item is kept for revalidation.
+
+        Raises:
+            ValueError: If the eviction policy is not supported.
         """
+        if eviction_policy not in self.EVICTION_POLICIES:
+            raise ValueError(
+                f"Unsupported eviction policy: {eviction_policy}. "
+                f"Expected one of {', '.join(self.EVICTION_POLICIES)}"
+            )
+
         self.max_size = max_size
         self.ttl = ttl
-        self.cache: Dict[str, Tuple[Any, float]] = {}
+        self.eviction_policy = eviction_policy
+        self.max_bytes = max_bytes
+        self.stale_ttl = stale_ttl
         self.lock = Lock()
-    
-    def _generate_key(self, method: str, endpoint: str, params: Optional[Dict] = None, 
+
+        # Entries in recency order (least recently used first)
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        # Keys grouped by access frequency for LFU eviction
+        self._frequencies: Dict[int, "OrderedDict[str, None]"] = {}
+        self._min_frequency = 0
+        # (purge_at, key) pairs; outdated pairs are skipped when popped
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._total_bytes = 0
+        # Keys with a background refresh in progress
+        self._refreshing: Set[str] = set()
+
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._revalidations = 0
+
+    def _generate_key(self, method: str, endpoint: str, params: Optional[Dict] = None,
                      json_data: Optional[Dict] = None) -> str:
         """Generate a cache key from request parameters.
-        
+
         Args:
             method: HTTP method (GET, POST, etc.).
             endpoint: API endpoint.
             params: Query parameters.
             json_data: JSON request body.
-            
+
         Returns:
             A string key for the cache.
         """
-        key_parts = [method.upper(), endpoint]
-        
-        if params:
-            # Sort params to ensure consistent keys
-            sorted_params = json.dumps(params, sort_keys=True)
-            key_parts.append(sorted_params)
-        
-        if json_data:
-            # Sort json data to ensure consistent keys
-            sorted_json = json.dumps(json_data, sort_keys=True)
-            key_parts.append(sorted_json)
-        
-        # Join parts and create a hash
-        key_string = ":".join(key_parts)
-        return hashlib.md5(key_string.encode()).hexdigest()
-    
-    def get(self, method: str, endpoint: str, params: Optional[Dict] = None, 
+        return generate_request_key(method, endpoint, params, json_data)
+
+    def _estimate_size(self, value: Any) -> int:
+        """Estimate the size of a value in bytes.
+
+        Args:
+            value: Value to measure.
+
+        Returns:
+            The size of the value's JSON encoding, or its shallow size if it
+            cannot be encoded.
+        """
+        try:
+            return len(json.dumps(value, default=str).encode())
+        except (TypeError, ValueError):
+            return sys.getsizeof(value)
+
+    def _add_to_frequency(self, key: str, frequency: int) -> None:
+        """Add a key to the bucket for its access frequency."""
+        self._frequencies.setdefault(frequency, OrderedDict())[key] = None
+
+    def _remove_from_frequency(self, key: str, frequency: int) -> None:
+        """Remove a key from the bucket for its access frequency."""
+        bucket = self._frequencies.get(frequency)
+        if bucket is None:
+            return
+        bucket.pop(key, None)
+        if not bucket:
+            del self._frequencies[frequency]
+
+    def _touch(self, key: str, entry: _CacheEntry) -> None:
+        """Record an access to an entry for eviction ordering."""
+        if self.eviction_policy == "lru":
+            self._entries.move_to_end(key)
+            return
+
+        self._remove_from_frequency(key, entry.frequency)
+        if entry.frequency == self._min_frequency and entry.frequency not in self._frequencies:
+            self._min_frequency += 1
+        entry.frequency += 1
+        self._add_to_frequency(key, entry.frequency)
+
+    def _remove(self, key: str) -> Optional[_CacheEntry]:
+        """Remove an entry and its bookkeeping.
+
+        Returns:
+            The removed entry, or None if the key was not cached.
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+        self._total_bytes -= entry.size
+        if self.eviction_policy == "lfu":
+            self._remove_from_frequency(key, entry.frequency)
+        return entry
+
+    def _evict_one(self) -> None:
+        """Evict a single entry according to the eviction policy."""
+        if self.eviction_policy == "lru":
+            key = next(iter(self._entries))
+        else:
+            if self._min_frequency not in self._frequencies:
+                self._min_frequency = min(self._frequencies)
+            key = next(iter(self._frequencies[self._min_frequency]))
+        self._remove(key)
+        self._evictions += 1
+
+    def _purge_at(self, entry: _CacheEntry) -> float:
+        """Get the time after which an entry can no longer be served or revalidated."""
+        return entry.expires_at + self.stale_ttl
+
+    def _purge_expired(self, now: float) -> None:
+        """Drop entries whose expiry time and stale window have passed."""
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            purge_at, key = heapq.heappop(heap)
+            entry = self._entries.get(key)
+            if entry is not None and self._purge_at(entry) == purge_at:
+                self._remove(key)
+                self._expirations += 1
+
+        # Rebuild the heap when overwritten keys leave too many outdated pairs
+        if len(heap) > 2 * len(self._entries) + 64:
+            self._expiry_heap = [(self._purge_at(entry), key) for key, entry in self._entries.items()]
+            heapq.heapify(self._expiry_heap)
+
+    def _get_entry(self, key: str, now: float) -> Optional[_CacheEntry]:
+        """Get an entry that is fresh or within its stale window.
+
+        Must be called with the lock held.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if self._purge_at(entry) <= now:
+            # Remove expired item
+            self._remove(key)
+            self._expirations += 1
+            return None
+
+        return entry
+
+    def get(self, method: str, endpoint: str, params: Optional[Dict] = None,
            json_data: Optional[Dict] = None) -> Optional[Any]:
         """Get a value from the cache.
-        
+
         Args:
             method: HTTP method (GET, POST, etc.).
             endpoint: API endpoint.
             params: Query parameters.
             json_data: JSON request body.
-            
+
         Returns:
             The cached value, or None if not found or expired.
         """
         key = self._generate_key(method, endpoint, params, json_data)
-        
+
+        with self.lock:
+            now = time.time()
+            entry = self._get_entry(key, now)
+            if entry is None or entry.expires_at <= now:
+                self._misses += 1
+                return None
+
+            self._touch(key, entry)
+            self._hits += 1
+            return entry.value
+
+    def lookup(self, method: str, endpoint: str, params: Optional[Dict] = None,
+               json_data: Optional[Dict] = None) -> Optional[CacheLookup]:
+        """Look up a value that may be served stale.
+
+        Args:
+            method: HTTP method (GET, POST, etc.).
+            endpoint: API endpoint.
+            params: Query parameters.
+            json_data: JSON request body.
+
+        Returns:
+            A CacheLookup with the value, whether it is stale and its validators,
+            or None if not found or past its stale window.
+        """
+        key = self._generate_key(method, endpoint, params, json_data)
+
         with self.lock:
-            if key in self.cache:
-                value, timestamp = self.cache[key]
-                if time.time() - timestamp <= self.ttl:
-                    return value
-                else:
-                    # Remove expired item
-                    del self.cache[key]
-        
-        return None
-    
-    def set(self, method: str, endpoint: str, value: Any, params: Optional[Dict] = None, 
-           json_data: Optional[Dict] = None) -> None:
+            now = time.time()
+            entry = self._get_entry(key, now)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            stale = entry.expires_at <= now
+            if stale:
+                self._stale_hits += 1
+            else:
+                self._hits += 1
+            self._touch(key, entry)
+            return CacheLookup(entry.value, stale, entry.etag, entry.last_modified)
+
+    def set(self, method: str, endpoint: str, value: Any, params: Optional[Dict] = None,
+           json_data: Optional[Dict] = None, etag: Optional[str] = None,
+           last_modified: Optional[str] = None) -> None:
         """Set a value in the cache.
-        
+
+        Values larger than ``max_bytes`` are not cached.
+
         Args:
             method: HTTP method (GET, POST, etc.).
             endpoint: API endpoint.
             value: Value to cache.
             params: Query parameters.
             json_data: JSON request body.
+            etag: ``ETag`` header of the response, used for revalidation.
+            last_modified: ``Last-Modified`` header of the response, used for revalidation.
         """
         key = self._generate_key(method, endpoint, params, json_data)
-        
+        size = self._estimate_size(value) if self.max_bytes else 0
+
         with self.lock:
-            # Evict oldest items if cache is full
-            if len(self.cache) >= self.max_size and key not in self.cache:
-                oldest_key = min(self.cache.items(), key=lambda x: x[1][1])[0]
-                del self.cache[oldest_key]
-            
-            self.cache[key] = (value, time.time())
-    
+            now = time.time()
+            self._purge_expired(now)
+            self._remove(key)
+
+            if self.max_bytes and size > self.max_bytes:
+                return
+
+            # Evict items until the new entry fits
+            while self._entries and (
+                len(self._entries) >= self.max_size
+                or (self.max_bytes and self._total_bytes + size > self.max_bytes)
+            ):
+                self._evict_one()
+
+            entry = _CacheEntry(value, now + self.ttl, size, etag, last_modified)
+            self._entries[key] = entry
+            self._total_bytes += size
+            if self.eviction_policy == "lfu":
+                self._add_to_frequency(key, entry.frequency)
+                self._min_frequency = entry.frequency
+            heapq.heappush(self._expiry_heap, (self._purge_at(entry), key))
+
+    def renew(self, method: str, endpoint: str, params: Optional[Dict] = None,
+              json_data: Optional[Dict] = None) -> Optional[Any]:
+        """Make a cached value fresh again after the server reported it unchanged.
+
+        Args:
+            method: HTTP method (GET, POST, etc.).
+            endpoint: API endpoint.
+            params: Query parameters.
+            json_data: JSON request body.
+
+        Returns:
+            The renewed value, or None if it is no longer cached.
+        """
+        key = self._generate_key(method, endpoint, params, json_data)
+
+        with self.lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            entry.expires_at = time.time() + self.ttl
+            heapq.heappush(self._expiry_heap, (self._purge_at(entry), key))
+            self._revalidations += 1
+            return entry.value
+
+    def begin_refresh(self, method: str, endpoint: str, params: Optional[Dict] = None,
+                      json_data: Optional[Dict] = None) -> bool:
+        """Claim the background refresh of a cached value.
+
+        Returns:
+            True if the caller should refresh the value, False if another
+            refresh is already in progress.
+        """
+        key = self._generate_key(method, endpoint, params, json_data)
+
+        with self.lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def end_refresh(self, method: str, endpoint: str, params: Optional[Dict] = None,
+                    json_data: Optional[Dict] = None) -> None:
+        """Release a refresh claimed with ``begin_refresh``."""
+        key = self._generate_key(method, endpoint, params, json_data)
+
+        with self.lock:
+            self._refreshing.discard(key)
+
     def clear(self) -> None:
         """Clear the cache."""
         with self.lock:
-            self.cache.clear()
-    
+            self._entries.clear()
+            self._frequencies.clear()
+            self._expiry_heap.clear()
+            self._min_frequency = 0
+            self._total_bytes = 0
+
+    def __len__(self) -> int:
+        """Get the number of cached items, including expired items not yet purged."""
+        return len(self._entries)
+
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics.
-        
+
         Returns:
             A dictionary with cache statistics.
         """
         with self.lock:
             current_time = time.time()
-            total_items = len(self.cache)
-            expired_items = sum(1 for _, timestamp in self.cache.values() 
-                               if current_time - timestamp > self.ttl)
+            total_items = len(self._entries)
+            expired_items = sum(1 for entry in self._entries.values()
+                               if entry.expires_at <= current_time)
             valid_items = total_items - expired_items
-            
+            total_lookups = self._hits + self._stale_hits + self._misses
+
             return {
                 "total_items": total_items,
                 "valid_items": valid_items,
@@ -127,5 +440,16 @@ class ResponseCache:
                 "max_size": self.max_size,
                 "ttl": self.ttl,
                 "utilization": total_items / self.max_size if self.max_size > 0 else 0,
+                "eviction_policy": self.eviction_policy,
+                "total_bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "stale_ttl": self.stale_ttl,
+                "hits": self._hits,
+                "stale_hits": self._stale_hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / total_lookups if total_lookups > 0 else 0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "revalidations": self._revalidations,
+                "refreshes_in_progress": len(self._refreshing),
             }
-
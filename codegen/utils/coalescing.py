@@ -0,0 +1,152 @@
+"""
+Request coalescing utilities for the Codegen API client.
+
+This module contains single-flight helpers that let concurrent identical
+requests share one upstream call.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+class _Call:
+    """An in-flight call and its outcome."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Share one call among threads that request the same key at the same time.
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight wait for it and receive the same result or exception.
+    """
+
+    def __init__(self):
+        """Initialize the single-flight group."""
+        self.lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self._executed = 0
+        self._coalesced = 0
+
+    def do(self, key: str, func: Callable[[], Any]) -> Any:
+        """Run a function, or wait for the in-flight run with the same key.
+
+        Args:
+            key: Key identifying identical calls.
+            func: Function to run if no call with this key is in flight.
+
+        Returns:
+            The result of the shared call.
+
+        Raises:
+            Exception: Whatever the shared call raised.
+        """
+        with self.lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self._executed += 1
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self.lock:
+                del self._calls[key]
+            call.done.set()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get coalescing statistics.
+
+        Returns:
+            A dictionary with coalescing statistics.
+        """
+        with self.lock:
+            return {
+                "in_flight": len(self._calls),
+                "executed": self._executed,
+                "coalesced": self._coalesced,
+            }
+
+
+class AsyncSingleFlight:
+    """Share one coroutine among tasks that request the same key at the same time.
+
+    Must be used from a single event loop.
+    """
+
+    def __init__(self):
+        """Initialize the single-flight group."""
+        self._calls: Dict[str, asyncio.Future] = {}
+        self._executed = 0
+        self._coalesced = 0
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Await a coroutine function, or the in-flight call with the same key.
+
+        Args:
+            key: Key identifying identical calls.
+            func: Coroutine function to await if no call with this key is in flight.
+
+        Returns:
+            The result of the shared call.
+
+        Raises:
+            Exception: Whatever the shared call raised.
+        """
+        future = self._calls.get(key)
+        if future is not None:
+            self._coalesced += 1
+            # Shield the shared call so one waiter's cancellation doesn't cancel it for everyone
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        self._executed += 1
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved in case nobody else was waiting
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get coalescing statistics.
+
+        Returns:
+            A dictionary with coalescing statistics.
+        """
+        return {
+            "in_flight": len(self._calls),
+            "executed": self._executed,
+            "coalesced": self._coalesced,
+        }
@@ -5,11 +5,15 @@ import time
 import asyncio
 import logging
 import hashlib
+import heapq
 import hmac
+import sys
+import threading
 from datetime import datetime
-from typing import Optional, Dict, Any, List, Union, Callable, AsyncGenerator, Iterator
+from typing import Optional, Dict, Any, List, Union, Callable, AsyncGenerator, Iterator, NamedTuple, Set
 from dataclasses import dataclass, field
 from enum import Enum
+from collections import OrderedDict
 from functools import wraps, lru_cache
 from threading import Lock
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -334,6 +338,8 @@ class ClientStats:
     cache_hit_rate: float
     status_code_distribution: Dict[int, int]
     recent_requests: List[RequestMetrics]
+    rate_limit_waits: int = 0
+    rate_limit_wait_seconds: float = 0.0
 
 
 # ============================================================================
@@ -368,6 +374,9 @@ class ClientConfig:
     rate_limit_period_seconds: int = field(
         default_factory=lambda: int(os.getenv("CODEGEN_RATE_LIMIT_PERIOD", "60"))
     )
+    rate_limit_burst: Optional[int] = field(
+        default_factory=lambda: int(os.getenv("CODEGEN_RATE_LIMIT_BURST", "0")) or None
+    )
     rate_limit_buffer: float = 0.1
     enable_caching: bool = field(
         default_factory=lambda: os.getenv("CODEGEN_ENABLE_CACHING", "true").lower()
@@ -379,6 +388,27 @@ class ClientConfig:
     cache_max_size: int = field(
         default_factory=lambda: int(os.getenv("CODEGEN_CACHE_MAX_SIZE", "128"))
     )
+    cache_eviction_policy: str = field(
+        default_factory=lambda: os.getenv("CODEGEN_CACHE_EVICTION_POLICY", "lru").lower()
+    )
+    cache_max_bytes: Optional[int] = field(
+        default_factory=lambda: int(os.getenv("CODEGEN_CACHE_MAX_BYTES", "0")) or None
+    )
+    cache_stale_ttl_seconds: int = field(
+        default_factory=lambda: int(os.getenv("CODEGEN_CACHE_STALE_TTL", "0"))
+    )
+    cache_stale_while_revalidate: bool = field(
+        default_factory=lambda: os.getenv(
+            "CODEGEN_CACHE_STALE_WHILE_REVALIDATE", "false"
+        ).lower()
+        == "true"
+    )
+    enable_request_coalescing: bool = field(
+        default_factory=lambda: os.getenv(
+            "CODEGEN_ENABLE_REQUEST_COALESCING", "true"
+        ).lower()
+        == "true"
+    )
     enable_webhooks: bool = field(
         default_factory=lambda: os.getenv("CODEGEN_ENABLE_WEBHOOKS", "true").lower()
         == "true"
@@ -519,94 +549,288 @@ def retry_with_backoff(
 
 
 class RateLimiter:
-    def __init__(self, requests_per_period: int, period_seconds: int):
+    """Token-bucket rate limiter with blocking and awaitable acquisition"""
+
+    def __init__(
+        self,
+        requests_per_period: int,
+        period_seconds: int,
+        burst: Optional[int] = None,
+        metrics: Optional["MetricsCollector"] = None,
+    ):
         self.requests_per_period = requests_per_period
         self.period_seconds = period_seconds
-        self.requests = []
+        self.burst = burst or requests_per_period
+        self.rate = requests_per_period / period_seconds
+        self.metrics = metrics
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
         self.lock = Lock()
 
-    def wait_if_needed(self):
+    def _refill(self, now: float):
+        elapsed = now - self._last_refill
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._last_refill = now
+
+    def _reserve(self) -> float:
+        # Reserve a token in O(1); callers sleep outside the lock so waiters are spaced out
         with self.lock:
-            now = time.time()
-            self.requests = [
-                req_time
-                for req_time in self.requests
-                if now - req_time < self.period_seconds
-            ]
-            if len(self.requests) >= self.requests_per_period:
-                sleep_time = self.period_seconds - (now - self.requests[0])
-                if sleep_time > 0:
-                    logger.info(f"Rate limit reached, sleeping for {sleep_time:.2f}s")
-                    time.sleep(sleep_time)
-            self.requests.append(now)
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            wait_time = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait_time > 0:
+            logger.info(f"Rate limit reached, waiting {wait_time:.2f}s")
+        if self.metrics:
+            self.metrics.record_rate_limit_wait(wait_time)
+        return wait_time
+
+    def wait_if_needed(self):
+        wait_time = self._reserve()
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+    async def acquire(self):
+        wait_time = self._reserve()
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
 
     def get_current_usage(self) -> Dict[str, Any]:
         with self.lock:
-            now = time.time()
-            recent_requests = [
-                req_time
-                for req_time in self.requests
-                if now - req_time < self.period_seconds
-            ]
-            return {
-                "current_requests": len(recent_requests),
-                "max_requests": self.requests_per_period,
-                "period_seconds": self.period_seconds,
-                "usage_percentage": (len(recent_requests) / self.requests_per_period)
-                * 100,
-            }
+            self._refill(time.monotonic())
+            available_tokens = self._tokens
+        current_requests = max(0.0, self.burst - available_tokens)
+        return {
+            "current_requests": current_requests,
+            "max_requests": self.requests_per_period,
+            "period_seconds": self.period_seconds,
+            "burst": self.burst,
+            "available_tokens": max(0.0, available_tokens),
+            "usage_percentage": (current_requests / self.burst) * 100,
+        }
+
+
+class _CacheEntry:
+    __slots__ = ("value", "expires_at", "size", "frequency", "etag", "last_modified")
+
+    def __init__(
+        self,
+        value: Any,
+        expires_at: float,
+        size: int,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ):
+        self.value = value
+        self.expires_at = expires_at
+        self.size = size
+        self.frequency = 1
+        self.etag = etag
+        self.last_modified = last_modified
+
+
+class CachedValue(NamedTuple):
+    value: Any
+    stale: bool
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
 
 
 class CacheManager:
-    def __init__(self, max_size: int = 128, ttl_seconds: int = 300):
+    """LRU/LFU cache with O(1) eviction and lazy heap-based TTL expiry"""
+
+    EVICTION_POLICIES = ("lru", "lfu")
+
+    def __init__(
+        self,
+        max_size: int = 128,
+        ttl_seconds: int = 300,
+        eviction_policy: str = "lru",
+        max_bytes: Optional[int] = None,
+        stale_ttl_seconds: int = 0,
+    ):
+        if eviction_policy not in self.EVICTION_POLICIES:
+            raise ValueError(f"Unsupported eviction policy: {eviction_policy}")
         self.max_size = max_size
         self.ttl_seconds = ttl_seconds
-        self._cache: Dict[str, Any] = {}
-        self._timestamps: Dict[str, float] = {}
-        self._access_counts: Dict[str, int] = {}
+        self.eviction_policy = eviction_policy
+        self.max_bytes = max_bytes
+        # Expired entries are kept this long so they can be served stale or revalidated
+        self.stale_ttl_seconds = stale_ttl_seconds
+        # Entries in recency order, least recently used first
+        self._cache: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        # Keys grouped by access count, used for LFU eviction
+        self._frequencies: Dict[int, "OrderedDict[str, None]"] = {}
+        self._min_frequency = 0
+        # (expires_at, key) pairs; pairs for overwritten keys are skipped
+        self._expiry_heap: List[tuple] = []
+        self._total_bytes = 0
+        self._refreshing: Set[str] = set()
         self._lock = Lock()
         self._hits = 0
+        self._stale_hits = 0
         self._misses = 0
+        self._evictions = 0
+        self._revalidations = 0
+
+    def _estimate_size(self, value: Any) -> int:
+        try:
+            return len(json.dumps(value, default=str).encode())
+        except (TypeError, ValueError):
+            return sys.getsizeof(value)
+
+    def _remove_from_frequency(self, key: str, frequency: int):
+        bucket = self._frequencies.get(frequency)
+        if bucket is not None:
+            bucket.pop(key, None)
+            if not bucket:
+                del self._frequencies[frequency]
+
+    def _touch(self, key: str, entry: _CacheEntry):
+        if self.eviction_policy == "lru":
+            self._cache.move_to_end(key)
+            return
+        self._remove_from_frequency(key, entry.frequency)
+        if (
+            entry.frequency == self._min_frequency
+            and entry.frequency not in self._frequencies
+        ):
+            self._min_frequency += 1
+        entry.frequency += 1
+        self._frequencies.setdefault(entry.frequency, OrderedDict())[key] = None
+
+    def _remove(self, key: str):
+        entry = self._cache.pop(key, None)
+        if entry is None:
+            return
+        self._total_bytes -= entry.size
+        if self.eviction_policy == "lfu":
+            self._remove_from_frequency(key, entry.frequency)
+
+    def _evict_one(self):
+        if self.eviction_policy == "lru":
+            key = next(iter(self._cache))
+        else:
+            if self._min_frequency not in self._frequencies:
+                self._min_frequency = min(self._frequencies)
+            key = next(iter(self._frequencies[self._min_frequency]))
+        self._remove(key)
+        self._evictions += 1
+
+    def _purge_at(self, entry: _CacheEntry) -> float:
+        return entry.expires_at + self.stale_ttl_seconds
+
+    def _purge_expired(self, now: float):
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            purge_at, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            if entry is not None and self._purge_at(entry) == purge_at:
+                self._remove(key)
+        if len(heap) > 2 * len(self._cache) + 64:
+            self._expiry_heap = [(self._purge_at(e), k) for k, e in self._cache.items()]
+            heapq.heapify(self._expiry_heap)
+
+    def _get_entry(self, key: str, now: float) -> Optional[_CacheEntry]:
+        entry = self._cache.get(key)
+        if entry is not None and now >= self._purge_at(entry):
+            self._remove(key)
+            return None
+        return entry
 
     def get(self, key: str) -> Optional[Any]:
         with self._lock:
-            if key not in self._cache:
+            now = time.time()
+            entry = self._get_entry(key, now)
+            if entry is None or now >= entry.expires_at:
                 self._misses += 1
                 return None
-            if time.time() - self._timestamps[key] > self.ttl_seconds:
-                del self._cache[key]
-                del self._timestamps[key]
-                del self._access_counts[key]
+            self._hits += 1
+            self._touch(key, entry)
+            return entry.value
+
+    def lookup(self, key: str) -> Optional[CachedValue]:
+        """Like get, but also returns expired entries still within the stale window"""
+        with self._lock:
+            now = time.time()
+            entry = self._get_entry(key, now)
+            if entry is None:
                 self._misses += 1
                 return None
-            self._hits += 1
-            self._access_counts[key] = self._access_counts.get(key, 0) + 1
-            return self._cache[key]
+            stale = now >= entry.expires_at
+            if stale:
+                self._stale_hits += 1
+            else:
+                self._hits += 1
+            self._touch(key, entry)
+            return CachedValue(entry.value, stale, entry.etag, entry.last_modified)
+
+    def renew(self, key: str) -> Optional[Any]:
+        """Mark an entry fresh again after a 304 Not Modified response"""
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            entry.expires_at = time.time() + self.ttl_seconds
+            heapq.heappush(self._expiry_heap, (self._purge_at(entry), key))
+            self._revalidations += 1
+            return entry.value
+
+    def begin_refresh(self, key: str) -> bool:
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
 
-    def set(self, key: str, value: Any):
+    def end_refresh(self, key: str):
         with self._lock:
-            if len(self._cache) >= self.max_size and key not in self._cache:
-                if self._timestamps:
-                    oldest_key = min(self._timestamps, key=self._timestamps.get)
-                    del self._cache[oldest_key]
-                    del self._timestamps[oldest_key]
-                    if oldest_key in self._access_counts:
-                        del self._access_counts[oldest_key]
-            self._cache[key] = value
-            self._timestamps[key] = time.time()
-            self._access_counts[key] = self._access_counts.get(key, 0)
+            self._refreshing.discard(key)
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ):
+        size = self._estimate_size(value) if self.max_bytes else 0
+        with self._lock:
+            now = time.time()
+            self._purge_expired(now)
+            self._remove(key)
+            if self.max_bytes and size > self.max_bytes:
+                return
+            while self._cache and (
+                len(self._cache) >= self.max_size
+                or (self.max_bytes and self._total_bytes + size > self.max_bytes)
+            ):
+                self._evict_one()
+            entry = _CacheEntry(
+                value, now + self.ttl_seconds, size, etag, last_modified
+            )
+            self._cache[key] = entry
+            self._total_bytes += size
+            if self.eviction_policy == "lfu":
+                self._frequencies.setdefault(1, OrderedDict())[key] = None
+                self._min_frequency = 1
+            heapq.heappush(self._expiry_heap, (self._purge_at(entry), key))
 
     def clear(self):
         with self._lock:
             self._cache.clear()
-            self._timestamps.clear()
-            self._access_counts.clear()
+            self._frequencies.clear()
+            self._expiry_heap.clear()
+            self._min_frequency = 0
+            self._total_bytes = 0
             self._hits = 0
+            self._stale_hits = 0
             self._misses = 0
+            self._evictions = 0
+            self._revalidations = 0
 
     def get_stats(self) -> Dict[str, Any]:
         with self._lock:
-            total_requests = self._hits + self._misses
+            total_requests = self._hits + self._stale_hits + self._misses
             hit_rate = (self._hits / total_requests) * 100 if total_requests > 0 else 0
             return {
                 "size": len(self._cache),
@@ -615,9 +839,107 @@ class CacheManager:
                 "misses": self._misses,
                 "hit_rate_percentage": hit_rate,
                 "ttl_seconds": self.ttl_seconds,
+                "eviction_policy": self.eviction_policy,
+                "evictions": self._evictions,
+                "total_bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "stale_ttl_seconds": self.stale_ttl_seconds,
+                "stale_hits": self._stale_hits,
+                "revalidations": self._revalidations,
+                "refreshes_in_progress": len(self._refreshing),
+            }
+
+
+class _InFlightCall:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Shares one call among threads requesting the same key concurrently"""
+
+    def __init__(self):
+        self._calls: Dict[str, _InFlightCall] = {}
+        self._lock = Lock()
+        self._executed = 0
+        self._coalesced = 0
+
+    def do(self, key: str, func: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _InFlightCall()
+                self._executed += 1
+            else:
+                self._coalesced += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "in_flight": len(self._calls),
+                "executed": self._executed,
+                "coalesced": self._coalesced,
             }
 
 
+class AsyncSingleFlight:
+    """Shares one coroutine among tasks requesting the same key concurrently"""
+
+    def __init__(self):
+        self._calls: Dict[str, asyncio.Future] = {}
+        self._executed = 0
+        self._coalesced = 0
+
+    async def do(self, key: str, func: Callable[[], Any]) -> Any:
+        future = self._calls.get(key)
+        if future is not None:
+            self._coalesced += 1
+            return await asyncio.shield(future)
+        future = self._calls[key] = asyncio.get_running_loop().create_future()
+        self._executed += 1
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "in_flight": len(self._calls),
+            "executed": self._executed,
+            "coalesced": self._coalesced,
+        }
+
+
 class WebhookHandler:
     def __init__(self, secret_key: Optional[str] = None):
         self.secret_key = secret_key
@@ -730,8 +1052,17 @@ class MetricsCollector:
     def __init__(self):
         self.requests: List[RequestMetrics] = []
         self.start_time = datetime.now()
+        self.rate_limit_waits = 0
+        self.rate_limit_wait_seconds = 0.0
         self._lock = Lock()
 
+    def record_rate_limit_wait(self, wait_seconds: float):
+        if wait_seconds <= 0:
+            return
+        with self._lock:
+            self.rate_limit_waits += 1
+            self.rate_limit_wait_seconds += wait_seconds
+
     def record_request(
         self,
         method: str,
@@ -768,6 +1099,8 @@ class MetricsCollector:
                     cache_hit_rate=0,
                     status_code_distribution={},
                     recent_requests=[],
+                    rate_limit_waits=self.rate_limit_waits,
+                    rate_limit_wait_seconds=self.rate_limit_wait_seconds,
                 )
             uptime = (datetime.now() - self.start_time).total_seconds()
             total_requests = len(self.requests)
@@ -798,12 +1131,16 @@ class MetricsCollector:
                 cache_hit_rate=cache_hit_rate,
                 status_code_distribution=status_codes,
                 recent_requests=self.requests[-10:],
+                rate_limit_waits=self.rate_limit_waits,
+                rate_limit_wait_seconds=self.rate_limit_wait_seconds,
             )
 
     def reset(self):
         with self._lock:
             self.requests.clear()
             self.start_time = datetime.now()
+            self.rate_limit_waits = 0
+            self.rate_limit_wait_seconds = 0.0
 
 
 # ============================================================================
@@ -811,6 +1148,15 @@ class MetricsCollector:
 # ============================================================================
 
 
+def _conditional_headers(cached: CachedValue) -> Dict[str, str]:
+    headers = {}
+    if cached.etag:
+        headers["If-None-Match"] = cached.etag
+    if cached.last_modified:
+        headers["If-Modified-Since"] = cached.last_modified
+    return headers
+
+
 class CodegenClient:
     def __init__(self, config: Optional[ClientConfig] = None):
         self.config = config or ClientConfig()
@@ -821,14 +1167,20 @@ class CodegenClient:
         }
         self.session = requests.Session()
         self.session.headers.update(self.headers)
+        self.metrics = MetricsCollector() if self.config.enable_metrics else None
         self.rate_limiter = RateLimiter(
             self.config.rate_limit_requests_per_period,
             self.config.rate_limit_period_seconds,
+            burst=self.config.rate_limit_burst,
+            metrics=self.metrics,
         )
         self.cache = (
             CacheManager(
                 max_size=self.config.cache_max_size,
                 ttl_seconds=self.config.cache_ttl_seconds,
+                eviction_policy=self.config.cache_eviction_policy,
+                max_bytes=self.config.cache_max_bytes,
+                stale_ttl_seconds=self.config.cache_stale_ttl_seconds,
             )
             if self.config.enable_caching
             else None
@@ -846,7 +1198,14 @@ class CodegenClient:
             if self.config.enable_bulk_operations
             else None
         )
-        self.metrics = MetricsCollector() if self.config.enable_metrics else None
+        self._refresh_executor = (
+            ThreadPoolExecutor(max_workers=4, thread_name_prefix="codegen-cache-refresh")
+            if self.cache and self.config.cache_stale_while_revalidate
+            else None
+        )
+        self._in_flight = (
+            SingleFlight() if self.config.enable_request_coalescing else None
+        )
         logger.info(f"Initialized CodegenClient with base URL: {self.config.base_url}")
 
     def _generate_request_id(self) -> str:
@@ -892,18 +1251,66 @@ class CodegenClient:
         self, method: str, endpoint: str, use_cache: bool = False, **kwargs
     ) -> Dict[str, Any]:
         request_id = self._generate_request_id()
-        self.rate_limiter.wait_if_needed()
         cache_key = None
+        cached = None
         if use_cache and self.cache and method.upper() == "GET":
             cache_key = f"{method}:{endpoint}:{hash(str(kwargs))}"
-            cached_result = self.cache.get(cache_key)
-            if cached_result is not None:
+            cached = self.cache.lookup(cache_key)
+            if cached is not None and (not cached.stale or self._refresh_executor):
+                # Serve stale entries immediately while a single refresh runs
+                if cached.stale and self.cache.begin_refresh(cache_key):
+                    self._refresh_executor.submit(
+                        self._refresh_cached, method, endpoint, cache_key, cached, kwargs
+                    )
                 logger.debug(f"Cache hit for {endpoint} (request_id: {request_id})")
                 if self.metrics:
                     self.metrics.record_request(
                         method, endpoint, 0, 200, request_id, cached=True
                     )
-                return cached_result
+                return cached.value
+        if self._in_flight is not None and method.upper() == "GET":
+            return self._in_flight.do(
+                f"{method}:{endpoint}:{hash(str(kwargs))}",
+                lambda: self._send_request(
+                    method, endpoint, request_id, cache_key, cached, **kwargs
+                ),
+            )
+        return self._send_request(
+            method, endpoint, request_id, cache_key, cached, **kwargs
+        )
+
+    def _refresh_cached(
+        self,
+        method: str,
+        endpoint: str,
+        cache_key: str,
+        cached: CachedValue,
+        kwargs: Dict[str, Any],
+    ):
+        try:
+            self._send_request(
+                method, endpoint, self._generate_request_id(), cache_key, cached, **kwargs
+            )
+        except Exception as e:
+            logger.warning(f"Background refresh of {endpoint} failed: {e}")
+        finally:
+            self.cache.end_refresh(cache_key)
+
+    def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        request_id: str,
+        cache_key: Optional[str] = None,
+        cached: Optional[CachedValue] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        self.rate_limiter.wait_if_needed()
+        if cached is not None:
+            kwargs["headers"] = {
+                **kwargs.get("headers", {}),
+                **_conditional_headers(cached),
+            }
 
         @retry_with_backoff(
             max_retries=self.config.max_retries,
@@ -936,9 +1343,17 @@ class CodegenClient:
                     self.metrics.record_request(
                         method, endpoint, duration, response.status_code, request_id
                     )
+                if response.status_code == 304 and cached is not None:
+                    renewed = self.cache.renew(cache_key)
+                    return renewed if renewed is not None else cached.value
                 result = self._handle_response(response, request_id)
                 if cache_key and response.ok:
-                    self.cache.set(cache_key, result)
+                    self.cache.set(
+                        cache_key,
+                        result,
+                        etag=response.headers.get("ETag"),
+                        last_modified=response.headers.get("Last-Modified"),
+                    )
                 return result
             except requests_exceptions.Timeout:
                 duration = time.time() - start_time
@@ -1314,9 +1729,13 @@ class CodegenClient:
                 "average_response_time": client_stats.average_response_time,
                 "cache_hit_rate": client_stats.cache_hit_rate,
                 "status_code_distribution": client_stats.status_code_distribution,
+                "rate_limit_waits": client_stats.rate_limit_waits,
+                "rate_limit_wait_seconds": client_stats.rate_limit_wait_seconds,
             }
         if self.cache:
             stats["cache"] = self.cache.get_stats()
+        if self._in_flight is not None:
+            stats["coalescing"] = self._in_flight.get_stats()
         if hasattr(self, "rate_limiter"):
             stats["rate_limiter"] = self.rate_limiter.get_current_usage()
         return stats
@@ -1350,6 +1769,8 @@ class CodegenClient:
             }
 
     def close(self):
+        if self._refresh_executor:
+            self._refresh_executor.shutdown(wait=False)
         if self.session:
             self.session.close()
         logger.info("Client closed")
@@ -1371,14 +1792,20 @@ if AIOHTTP_AVAILABLE:
         def __init__(self, config: Optional[ClientConfig] = None):
             self.config = config or ClientConfig()
             self.session: Optional[aiohttp.ClientSession] = None
+            self.metrics = MetricsCollector() if self.config.enable_metrics else None
             self.rate_limiter = RateLimiter(
                 self.config.rate_limit_requests_per_period,
                 self.config.rate_limit_period_seconds,
+                burst=self.config.rate_limit_burst,
+                metrics=self.metrics,
             )
             self.cache = (
                 CacheManager(
                     max_size=self.config.cache_max_size,
                     ttl_seconds=self.config.cache_ttl_seconds,
+                    eviction_policy=self.config.cache_eviction_policy,
+                    max_bytes=self.config.cache_max_bytes,
+                    stale_ttl_seconds=self.config.cache_stale_ttl_seconds,
                 )
                 if self.config.enable_caching
                 else None
@@ -1388,7 +1815,10 @@ if AIOHTTP_AVAILABLE:
                 if self.config.enable_webhooks
                 else None
             )
-            self.metrics = MetricsCollector() if self.config.enable_metrics else None
+            self._refresh_tasks: Set[asyncio.Task] = set()
+            self._in_flight = (
+                AsyncSingleFlight() if self.config.enable_request_coalescing else None
+            )
             logger.info(
                 f"Initialized AsyncCodegenClient with base URL: {self.config.base_url}"
             )
@@ -1405,6 +1835,8 @@ if AIOHTTP_AVAILABLE:
             return self
 
         async def __aexit__(self, exc_type, exc_val, exc_tb):
+            for task in list(self._refresh_tasks):
+                task.cancel()
             if self.session:
                 await self.session.close()
 
@@ -1419,18 +1851,77 @@ if AIOHTTP_AVAILABLE:
                     "Client not initialized. Use 'async with' context manager."
                 )
             request_id = self._generate_request_id()
-            self.rate_limiter.wait_if_needed()
             cache_key = None
+            cached = None
             if use_cache and self.cache and method.upper() == "GET":
                 cache_key = f"{method}:{endpoint}:{hash(str(kwargs))}"
-                cached_result = self.cache.get(cache_key)
-                if cached_result is not None:
+                cached = self.cache.lookup(cache_key)
+                if cached is not None and (
+                    not cached.stale or self.config.cache_stale_while_revalidate
+                ):
+                    # Serve stale entries immediately while a single refresh runs
+                    if cached.stale and self.cache.begin_refresh(cache_key):
+                        task = asyncio.create_task(
+                            self._refresh_cached(
+                                method, endpoint, cache_key, cached, kwargs
+                            )
+                        )
+                        self._refresh_tasks.add(task)
+                        task.add_done_callback(self._refresh_tasks.discard)
                     logger.debug(f"Cache hit for {endpoint} (request_id: {request_id})")
                     if self.metrics:
                         self.metrics.record_request(
                             method, endpoint, 0, 200, request_id, cached=True
                         )
-                    return cached_result
+                    return cached.value
+            if self._in_flight is not None and method.upper() == "GET":
+                return await self._in_flight.do(
+                    f"{method}:{endpoint}:{hash(str(kwargs))}",
+                    lambda: self._send_request(
+                        method, endpoint, request_id, cache_key, cached, **kwargs
+                    ),
+                )
+            return await self._send_request(
+                method, endpoint, request_id, cache_key, cached, **kwargs
+            )
+
+        async def _refresh_cached(
+            self,
+            method: str,
+            endpoint: str,
+            cache_key: str,
+            cached: CachedValue,
+            kwargs: Dict[str, Any],
+        ):
+            try:
+                await self._send_request(
+                    method,
+                    endpoint,
+                    self._generate_request_id(),
+                    cache_key,
+                    cached,
+                    **kwargs,
+                )
+            except Exception as e:
+                logger.warning(f"Background refresh of {endpoint} failed: {e}")
+            finally:
+                self.cache.end_refresh(cache_key)
+
+        async def _send_request(
+            self,
+            method: str,
+            endpoint: str,
+            request_id: str,
+            cache_key: Optional[str] = None,
+            cached: Optional[CachedValue] = None,
+            **kwargs,
+        ) -> Dict[str, Any]:
+            await self.rate_limiter.acquire()
+            if cached is not None:
+                kwargs["headers"] = {
+                    **kwargs.get("headers", {}),
+                    **_conditional_headers(cached),
+                }
             start_time = time.time()
             url = f"{self.config.base_url}{endpoint}"
             if self.config.log_requests:
@@ -1448,6 +1939,9 @@ if AIOHTTP_AVAILABLE:
                         self.metrics.record_request(
                             method, endpoint, duration, response.status, request_id
                         )
+                    if response.status == 304 and cached is not None:
+                        renewed = self.cache.renew(cache_key)
+                        return renewed if renewed is not None else cached.value
                     if response.status == 429:
                         raise RateLimitError(
                             int(response.headers.get("Retry-After", 60)), request_id
@@ -1480,7 +1974,12 @@ if AIOHTTP_AVAILABLE:
                         )
                     result = await response.json()
                     if cache_key and response.ok:
-                        self.cache.set(cache_key, result)
+                        self.cache.set(
+                            cache_key,
+                            result,
+                            etag=response.headers.get("ETag"),
+                            last_modified=response.headers.get("Last-Modified"),
+                        )
                     return result
             except asyncio.TimeoutError:
                 duration = time.time() - start_time
@@ -1633,5 +2132,9 @@ if AIOHTTP_AVAILABLE:
                     "average_response_time": client_stats.average_response_time,
                     "cache_hit_rate": client_stats.cache_hit_rate,
                     "status_code_distribution": client_stats.status_code_distribution,
+                    "rate_limit_waits": client_stats.rate_limit_waits,
+                    "rate_limit_wait_seconds": client_stats.rate_limit_wait_seconds,
                 }
+            if self._in_flight is not None:
+                stats["coalescing"] = self._in_flight.get_stats()
             return stats
@@ -4,6 +4,7 @@ Codegen API Client.
 A Python client for interacting with the Codegen API.
 """
 
+from codegen_client.async_client import AsyncCodegenClient
 from codegen_client.client import CodegenClient
 from codegen_client.exceptions import (
     CodegenApiError,
@@ -20,6 +21,7 @@ from codegen_client.models.users import User, UserResponse
 
 __all__ = [
     "CodegenClient",
+    "AsyncCodegenClient",
     "CodegenApiError",
     "CodegenAuthError",
     "CodegenRateLimitError",
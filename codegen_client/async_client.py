@@ -0,0 +1,214 @@
+"""
+Async client for the Codegen API.
+"""
+
+from typing import Any, Dict, Optional
+
+import httpx
+
+from codegen_client.base import BaseCodegenClient
+from codegen_client.endpoints.agents import AsyncAgentsClient
+from codegen_client.endpoints.agents_alpha import AsyncAgentsAlphaClient
+from codegen_client.endpoints.integrations import AsyncIntegrationsClient
+from codegen_client.endpoints.multi_run_agent import AsyncMultiRunAgentClient
+from codegen_client.endpoints.organizations import AsyncOrganizationsClient
+from codegen_client.endpoints.repositories import AsyncRepositoriesClient
+from codegen_client.endpoints.sandbox import AsyncSandboxClient
+from codegen_client.endpoints.setup_commands import AsyncSetupCommandsClient
+from codegen_client.endpoints.users import AsyncUsersClient
+from codegen_client.utils.coalescing import AsyncSingleFlight, get_request_key
+
+
+class AsyncCodegenClient(BaseCodegenClient):
+    """
+    Async client for the Codegen API.
+
+    This client mirrors ``CodegenClient`` on top of ``httpx.AsyncClient``. All
+    async endpoint clients share one connection pool, so a single event loop
+    can drive many concurrent requests without a thread per request.
+
+    Example:
+        async with AsyncCodegenClient(api_key="...") as client:
+            runs = await client.agents.list_agent_runs(org_id=123)
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        timeout: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        user_agent: Optional[str] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        http2: Optional[bool] = None,
+    ):
+        """
+        Initialize the async Codegen API client.
+
+        Call ``await close()`` (or use the client as an async context manager)
+        to release the pooled connections.
+
+        Args:
+            api_key: API key for authentication (defaults to CODEGEN_API_KEY env var)
+            base_url: Base URL for the API (defaults to CODEGEN_BASE_URL env var or https://api.codegen.com/v1)
+            timeout: Request timeout in seconds (defaults to CODEGEN_TIMEOUT env var or 30)
+            max_retries: Maximum number of retries for failed requests (defaults to CODEGEN_MAX_RETRIES env var or 3)
+            user_agent: User agent string (defaults to CODEGEN_USER_AGENT env var or codegen-python-client)
+            max_connections: Maximum number of pooled connections (defaults to CODEGEN_MAX_CONNECTIONS env var or 100)
+            max_keepalive_connections: Maximum number of idle keep-alive connections
+                (defaults to CODEGEN_MAX_KEEPALIVE_CONNECTIONS env var or 20)
+            keepalive_expiry: Seconds an idle connection is kept open (defaults to CODEGEN_KEEPALIVE_EXPIRY env var or 30)
+            http2: Enable HTTP/2 multiplexing if the ``h2`` package is installed
+                (defaults to CODEGEN_HTTP2 env var or False)
+        """
+        super().__init__(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=timeout,
+            max_retries=max_retries,
+            user_agent=user_agent,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+        )
+
+        # Shared connection pool used by every async endpoint client
+        self._http = httpx.AsyncClient(
+            timeout=self.config.timeout,
+            limits=self._get_limits(),
+            http2=self._use_http2(),
+        )
+
+        # Concurrent identical GETs share one upstream call
+        if self.config.coalesce_requests:
+            self._single_flight = AsyncSingleFlight()
+
+        # Initialize endpoint clients
+        self.users = AsyncUsersClient(self)
+        self.agents = AsyncAgentsClient(self)
+        self.organizations = AsyncOrganizationsClient(self)
+        self.repositories = AsyncRepositoriesClient(self)
+        self.integrations = AsyncIntegrationsClient(self)
+        self.setup_commands = AsyncSetupCommandsClient(self)
+        self.sandbox = AsyncSandboxClient(self)
+        self.agents_alpha = AsyncAgentsAlphaClient(self)
+        self.multi_run_agent = AsyncMultiRunAgentClient(self)
+
+    async def close(self) -> None:
+        """
+        Close the client and release all pooled connections.
+        """
+        await self._http.aclose()
+
+    async def __aenter__(self) -> "AsyncCodegenClient":
+        """Enter async context manager."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Exit async context manager."""
+        await self.close()
+
+    async def _request(self, method: str, path: str, **kwargs: Any) -> Any:
+        """
+        Send a request over the shared connection pool.
+
+        Args:
+            method: HTTP method
+            path: API path (without base URL)
+            **kwargs: Additional arguments passed to ``httpx.AsyncClient.request``
+
+        Returns:
+            Any: Response data
+
+        Raises:
+            CodegenApiError: If the API request fails
+        """
+        url = f"{self.config.base_url}{path}"
+        self._request_started()
+        try:
+            response = await self._http.request(
+                method,
+                url,
+                headers=self._get_headers(),
+                **kwargs,
+            )
+        finally:
+            self._request_finished()
+        return self._handle_response(response)
+
+    async def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Make a GET request to the API.
+
+        Identical GETs issued concurrently share a single upstream request
+        when request coalescing is enabled.
+
+        Args:
+            path: API path (without base URL)
+            params: Query parameters
+
+        Returns:
+            Any: Response data
+
+        Raises:
+            CodegenApiError: If the API request fails
+        """
+        if self._single_flight is not None:
+            return await self._single_flight.do(
+                get_request_key("GET", path, params),
+                lambda: self._request("GET", path, params=params),
+            )
+        return await self._request("GET", path, params=params)
+
+    async def post(self, path: str, data: Optional[Dict[str, Any]] = None, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Make a POST request to the API.
+
+        Args:
+            path: API path (without base URL)
+            data: Request data
+            params: Query parameters
+
+        Returns:
+            Any: Response data
+
+        Raises:
+            CodegenApiError: If the API request fails
+        """
+        return await self._request("POST", path, params=params, json=data)
+
+    async def put(self, path: str, data: Optional[Dict[str, Any]] = None, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Make a PUT request to the API.
+
+        Args:
+            path: API path (without base URL)
+            data: Request data
+            params: Query parameters
+
+        Returns:
+            Any: Response data
+
+        Raises:
+            CodegenApiError: If the API request fails
+        """
+        return await self._request("PUT", path, params=params, json=data)
+
+    async def delete(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Make a DELETE request to the API.
+
+        Args:
+            path: API path (without base URL)
+            params: Query parameters
+
+        Returns:
+            Any: Response data
+
+        Raises:
+            CodegenApiError: If the API request fails
+        """
+        return await self._request("DELETE", path, params=params)
@@ -0,0 +1,232 @@
+"""
+Shared functionality for the synchronous and asynchronous Codegen API clients.
+"""
+
+import logging
+import threading
+from dataclasses import replace
+from typing import Any, Dict, Optional
+
+import httpx
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+from codegen_client.config import CodegenConfig
+from codegen_client.exceptions import (
+    CodegenApiError,
+    CodegenAuthError,
+    CodegenRateLimitError,
+    CodegenResourceNotFoundError,
+    CodegenValidationError,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class BaseCodegenClient:
+    """
+    Base class for the Codegen API clients.
+
+    This class holds the configuration, authentication headers, error handling
+    and connection pool bookkeeping shared by ``CodegenClient`` and
+    ``AsyncCodegenClient``. Subclasses create the pooled HTTP client in
+    ``self._http`` and, when request coalescing is enabled, a single-flight
+    group in ``self._single_flight``.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        timeout: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        user_agent: Optional[str] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        http2: Optional[bool] = None,
+    ):
+        """
+        Initialize the shared client state.
+
+        Args:
+            api_key: API key for authentication (defaults to CODEGEN_API_KEY env var)
+            base_url: Base URL for the API (defaults to CODEGEN_BASE_URL env var or https://api.codegen.com/v1)
+            timeout: Request timeout in seconds (defaults to CODEGEN_TIMEOUT env var or 30)
+            max_retries: Maximum number of retries for failed requests (defaults to CODEGEN_MAX_RETRIES env var or 3)
+            user_agent: User agent string (defaults to CODEGEN_USER_AGENT env var or codegen-python-client)
+            max_connections: Maximum number of pooled connections (defaults to CODEGEN_MAX_CONNECTIONS env var or 100)
+            max_keepalive_connections: Maximum number of idle keep-alive connections
+                (defaults to CODEGEN_MAX_KEEPALIVE_CONNECTIONS env var or 20)
+            keepalive_expiry: Seconds an idle connection is kept open (defaults to CODEGEN_KEEPALIVE_EXPIRY env var or 30)
+            http2: Enable HTTP/2 multiplexing if the ``h2`` package is installed
+                (defaults to CODEGEN_HTTP2 env var or False)
+        """
+        overrides = {
+            "api_key": api_key,
+            "base_url": base_url,
+            "timeout": timeout,
+            "max_retries": max_retries,
+            "user_agent": user_agent,
+            "max_connections": max_connections,
+            "max_keepalive_connections": max_keepalive_connections,
+            "keepalive_expiry": keepalive_expiry,
+            "http2": http2,
+        }
+        self.config = replace(
+            CodegenConfig.from_env(),
+            **{key: value for key, value in overrides.items() if value is not None},
+        )
+
+        self._stats_lock = threading.Lock()
+        self._total_requests = 0
+        self._in_flight = 0
+        self._single_flight = None
+
+    def _get_limits(self) -> httpx.Limits:
+        """
+        Get the connection pool limits for the HTTP client.
+
+        Returns:
+            httpx.Limits: Pool limits from the client configuration
+        """
+        return httpx.Limits(
+            max_connections=self.config.max_connections,
+            max_keepalive_connections=self.config.max_keepalive_connections,
+            keepalive_expiry=self.config.keepalive_expiry,
+        )
+
+    def _use_http2(self) -> bool:
+        """
+        Check whether HTTP/2 should be enabled for the HTTP client.
+
+        Returns:
+            bool: True if HTTP/2 is requested and the ``h2`` package is installed
+        """
+        if self.config.http2 and not HTTP2_AVAILABLE:
+            logger.warning("HTTP/2 requested but the 'h2' package is not installed; falling back to HTTP/1.1")
+            return False
+        return self.config.http2
+
+    @property
+    def closed(self) -> bool:
+        """
+        Whether the client has been closed.
+
+        Returns:
+            bool: True if the underlying connection pool has been closed
+        """
+        return self._http.is_closed
+
+    def _request_started(self) -> None:
+        """Record that a request has been sent over the pool."""
+        with self._stats_lock:
+            self._total_requests += 1
+            self._in_flight += 1
+
+    def _request_finished(self) -> None:
+        """Record that a request has completed."""
+        with self._stats_lock:
+            self._in_flight -= 1
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics for the shared connection pool.
+
+        Connection counts are read from the underlying transport when it
+        exposes them and are ``None`` otherwise.
+
+        Returns:
+            Dict[str, Any]: Pool configuration, request counters and connection counts
+        """
+        open_connections = None
+        idle_connections = None
+        pool = getattr(getattr(self._http, "_transport", None), "_pool", None)
+        connections = getattr(pool, "connections", None)
+        if connections is not None:
+            open_connections = len(connections)
+            idle_connections = sum(1 for connection in connections if connection.is_idle())
+
+        with self._stats_lock:
+            total_requests = self._total_requests
+            in_flight = self._in_flight
+
+        return {
+            "max_connections": self.config.max_connections,
+            "max_keepalive_connections": self.config.max_keepalive_connections,
+            "keepalive_expiry": self.config.keepalive_expiry,
+            "http2": self.config.http2 and HTTP2_AVAILABLE,
+            "closed": self.closed,
+            "total_requests": total_requests,
+            "in_flight_requests": in_flight,
+            "open_connections": open_connections,
+            "idle_connections": idle_connections,
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get client statistics.
+
+        Returns:
+            Dict[str, Any]: Connection pool statistics and, when enabled,
+                request coalescing counts
+        """
+        stats: Dict[str, Any] = {"pool": self.get_pool_stats()}
+        if self._single_flight is not None:
+            stats["coalescing"] = self._single_flight.get_stats()
+        return stats
+
+    def _get_headers(self) -> Dict[str, str]:
+        """
+        Get headers for API requests.
+
+        Returns:
+            Dict[str, str]: Headers for API requests
+        """
+        return {
+            "Authorization": f"Bearer {self.config.api_key}",
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "User-Agent": self.config.user_agent,
+        }
+
+    def _handle_response(self, response: httpx.Response) -> Any:
+        """
+        Handle API response and raise appropriate exceptions.
+
+        Args:
+            response: HTTP response
+
+        Returns:
+            Any: Response data
+
+        Raises:
+            CodegenAuthError: If authentication fails
+            CodegenRateLimitError: If rate limit is exceeded
+            CodegenResourceNotFoundError: If resource is not found
+            CodegenValidationError: If request validation fails
+            CodegenApiError: For other API errors
+        """
+        if response.status_code == 200:
+            return response.json()
+
+        error_data = response.json() if response.headers.get("content-type") == "application/json" else {}
+        error_message = error_data.get("message", response.text)
+
+        if response.status_code == 401:
+            raise CodegenAuthError(f"Authentication failed: {error_message}")
+        elif response.status_code == 403:
+            raise CodegenAuthError(f"Permission denied: {error_message}")
+        elif response.status_code == 404:
+            raise CodegenResourceNotFoundError(f"Resource not found: {error_message}")
+        elif response.status_code == 422:
+            raise CodegenValidationError(f"Validation error: {error_message}")
+        elif response.status_code == 429:
+            raise CodegenRateLimitError(f"Rate limit exceeded: {error_message}")
+        else:
+            raise CodegenApiError(f"API error ({response.status_code}): {error_message}")
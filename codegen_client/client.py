@@ -2,19 +2,11 @@
 Base client for the Codegen API.
 """
 
-import os
 from typing import Any, Dict, Optional
 
 import httpx
 
-from codegen_client.config import CodegenConfig
-from codegen_client.exceptions import (
-    CodegenApiError,
-    CodegenAuthError,
-    CodegenRateLimitError,
-    CodegenResourceNotFoundError,
-    CodegenValidationError,
-)
+from codegen_client.base import BaseCodegenClient
 from codegen_client.endpoints.agents import AgentsClient
 from codegen_client.endpoints.agents_alpha import AgentsAlphaClient
 from codegen_client.endpoints.integrations import IntegrationsClient
@@ -24,9 +16,10 @@ from codegen_client.endpoints.repositories import RepositoriesClient
 from codegen_client.endpoints.sandbox import SandboxClient
 from codegen_client.endpoints.setup_commands import SetupCommandsClient
 from codegen_client.endpoints.users import UsersClient
+from codegen_client.utils.coalescing import SingleFlight, get_request_key
 
 
-class CodegenClient:
+class CodegenClient(BaseCodegenClient):
     """
     Base client for the Codegen API.
 
@@ -41,25 +34,54 @@ class CodegenClient:
         timeout: Optional[int] = None,
         max_retries: Optional[int] = None,
         user_agent: Optional[str] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        http2: Optional[bool] = None,
     ):
         """
         Initialize the Codegen API client.
 
+        The client owns a single pooled HTTP transport that is shared by all
+        endpoint clients. Call ``close()`` (or use the client as a context
+        manager) to release the pooled connections.
+
         Args:
             api_key: API key for authentication (defaults to CODEGEN_API_KEY env var)
             base_url: Base URL for the API (defaults to CODEGEN_BASE_URL env var or https://api.codegen.com/v1)
             timeout: Request timeout in seconds (defaults to CODEGEN_TIMEOUT env var or 30)
             max_retries: Maximum number of retries for failed requests (defaults to CODEGEN_MAX_RETRIES env var or 3)
             user_agent: User agent string (defaults to CODEGEN_USER_AGENT env var or codegen-python-client)
+            max_connections: Maximum number of pooled connections (defaults to CODEGEN_MAX_CONNECTIONS env var or 100)
+            max_keepalive_connections: Maximum number of idle keep-alive connections
+                (defaults to CODEGEN_MAX_KEEPALIVE_CONNECTIONS env var or 20)
+            keepalive_expiry: Seconds an idle connection is kept open (defaults to CODEGEN_KEEPALIVE_EXPIRY env var or 30)
+            http2: Enable HTTP/2 multiplexing if the ``h2`` package is installed
+                (defaults to CODEGEN_HTTP2 env var or False)
         """
-        self.config = CodegenConfig(
+        super().__init__(
             api_key=api_key,
             base_url=base_url,
             timeout=timeout,
             max_retries=max_retries,
             user_agent=user_agent,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+        )
+
+        # Shared connection pool used by every endpoint client
+        self._http = httpx.Client(
+            timeout=self.config.timeout,
+            limits=self._get_limits(),
+            http2=self._use_http2(),
         )
 
+        # Concurrent identical GETs share one upstream call
+        if self.config.coalesce_requests:
+            self._single_flight = SingleFlight()
+
         # Initialize endpoint clients
         self.users = UsersClient(self)
         self.agents = AgentsClient(self)
@@ -71,60 +93,55 @@ class CodegenClient:
         self.agents_alpha = AgentsAlphaClient(self)
         self.multi_run_agent = MultiRunAgentClient(self)
 
-    def _get_headers(self) -> Dict[str, str]:
+    def close(self) -> None:
         """
-        Get headers for API requests.
-
-        Returns:
-            Dict[str, str]: Headers for API requests
+        Close the client and release all pooled connections.
         """
-        return {
-            "Authorization": f"Bearer {self.config.api_key}",
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            "User-Agent": self.config.user_agent,
-        }
-
-    def _handle_response(self, response: httpx.Response) -> Any:
+        self._http.close()
+
+    def __enter__(self) -> "CodegenClient":
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Exit context manager."""
+        self.close()
+
+    def _request(self, method: str, path: str, **kwargs: Any) -> Any:
         """
-        Handle API response and raise appropriate exceptions.
+        Send a request over the shared connection pool.
 
         Args:
-            response: HTTP response
+            method: HTTP method
+            path: API path (without base URL)
+            **kwargs: Additional arguments passed to ``httpx.Client.request``
 
         Returns:
             Any: Response data
 
         Raises:
-            CodegenAuthError: If authentication fails
-            CodegenRateLimitError: If rate limit is exceeded
-            CodegenResourceNotFoundError: If resource is not found
-            CodegenValidationError: If request validation fails
-            CodegenApiError: For other API errors
+            CodegenApiError: If the API request fails
         """
-        if response.status_code == 200:
-            return response.json()
-
-        error_data = response.json() if response.headers.get("content-type") == "application/json" else {}
-        error_message = error_data.get("message", response.text)
-
-        if response.status_code == 401:
-            raise CodegenAuthError(f"Authentication failed: {error_message}")
-        elif response.status_code == 403:
-            raise CodegenAuthError(f"Permission denied: {error_message}")
-        elif response.status_code == 404:
-            raise CodegenResourceNotFoundError(f"Resource not found: {error_message}")
-        elif response.status_code == 422:
-            raise CodegenValidationError(f"Validation error: {error_message}")
-        elif response.status_code == 429:
-            raise CodegenRateLimitError(f"Rate limit exceeded: {error_message}")
-        else:
-            raise CodegenApiError(f"API error ({response.status_code}): {error_message}")
+        url = f"{self.config.base_url}{path}"
+        self._request_started()
+        try:
+            response = self._http.request(
+                method,
+                url,
+                headers=self._get_headers(),
+                **kwargs,
+            )
+        finally:
+            self._request_finished()
+        return self._handle_response(response)
 
     def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
         """
         Make a GET request to the API.
 
+        Identical GETs issued concurrently share a single upstream request
+        when request coalescing is enabled.
+
         Args:
             path: API path (without base URL)
             params: Query parameters
@@ -135,15 +152,12 @@ class CodegenClient:
         Raises:
             CodegenApiError: If the API request fails
         """
-        url = f"{self.config.base_url}{path}"
-        with httpx.Client() as client:
-            response = client.get(
-                url,
-                params=params,
-                headers=self._get_headers(),
-                timeout=self.config.timeout,
+        if self._single_flight is not None:
+            return self._single_flight.do(
+                get_request_key("GET", path, params),
+                lambda: self._request("GET", path, params=params),
             )
-            return self._handle_response(response)
+        return self._request("GET", path, params=params)
 
     def post(self, path: str, data: Optional[Dict[str, Any]] = None, params: Optional[Dict[str, Any]] = None) -> Any:
         """
@@ -160,16 +174,7 @@ class CodegenClient:
         Raises:
             CodegenApiError: If the API request fails
         """
-        url = f"{self.config.base_url}{path}"
-        with httpx.Client() as client:
-            response = client.post(
-                url,
-                json=data,
-                params=params,
-                headers=self._get_headers(),
-                timeout=self.config.timeout,
-            )
-            return self._handle_response(response)
+        return self._request("POST", path, params=params, json=data)
 
     def put(self, path: str, data: Optional[Dict[str, Any]] = None, params: Optional[Dict[str, Any]] = None) -> Any:
         """
@@ -186,16 +191,7 @@ class CodegenClient:
         Raises:
             CodegenApiError: If the API request fails
         """
-        url = f"{self.config.base_url}{path}"
-        with httpx.Client() as client:
-            response = client.put(
-                url,
-                json=data,
-                params=params,
-                headers=self._get_headers(),
-                timeout=self.config.timeout,
-            )
-            return self._handle_response(response)
+        return self._request("PUT", path, params=params, json=data)
 
     def delete(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
         """
@@ -211,13 +207,5 @@ class CodegenClient:
         Raises:
             CodegenApiError: If the API request fails
         """
-        url = f"{self.config.base_url}{path}"
-        with httpx.Client() as client:
-            response = client.delete(
-                url,
-                params=params,
-                headers=self._get_headers(),
-                timeout=self.config.timeout,
-            )
-            return self._handle_response(response)
+        return self._request("DELETE", path, params=params)
 
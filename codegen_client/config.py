@@ -16,6 +16,11 @@ class CodegenConfig:
     timeout: int = 30
     max_retries: int = 3
     user_agent: str = "codegen-python-client"
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+    coalesce_requests: bool = True
 
     @classmethod
     def from_env(cls) -> "CodegenConfig":
@@ -28,6 +33,11 @@ class CodegenConfig:
             CODEGEN_TIMEOUT: Request timeout in seconds (default: 30)
             CODEGEN_MAX_RETRIES: Maximum number of retries for failed requests (default: 3)
             CODEGEN_USER_AGENT: User agent string (default: codegen-python-client)
+            CODEGEN_MAX_CONNECTIONS: Maximum number of pooled connections (default: 100)
+            CODEGEN_MAX_KEEPALIVE_CONNECTIONS: Maximum number of idle keep-alive connections (default: 20)
+            CODEGEN_KEEPALIVE_EXPIRY: Seconds an idle connection is kept open (default: 30)
+            CODEGEN_HTTP2: Enable HTTP/2 multiplexing, "true" or "false" (default: false)
+            CODEGEN_COALESCE_REQUESTS: Share one call among concurrent identical GETs, "true" or "false" (default: true)
 
         Returns:
             CodegenConfig: Configuration object with values from environment variables
@@ -38,5 +48,15 @@ class CodegenConfig:
             timeout=int(os.environ.get("CODEGEN_TIMEOUT", cls.timeout)),
             max_retries=int(os.environ.get("CODEGEN_MAX_RETRIES", cls.max_retries)),
             user_agent=os.environ.get("CODEGEN_USER_AGENT", cls.user_agent),
+            max_connections=int(os.environ.get("CODEGEN_MAX_CONNECTIONS", cls.max_connections)),
+            max_keepalive_connections=int(
+                os.environ.get("CODEGEN_MAX_KEEPALIVE_CONNECTIONS", cls.max_keepalive_connections)
+            ),
+            keepalive_expiry=float(os.environ.get("CODEGEN_KEEPALIVE_EXPIRY", cls.keepalive_expiry)),
+            http2=os.environ.get("CODEGEN_HTTP2", str(cls.http2)).lower() == "true",
+            coalesce_requests=os.environ.get(
+                "CODEGEN_COALESCE_REQUESTS", str(cls.coalesce_requests)
+            ).lower()
+            == "true",
         )
 
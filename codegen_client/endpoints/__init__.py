@@ -2,14 +2,15 @@
 API endpoint clients for the Codegen API.
 """
 
-from codegen_client.endpoints.users import UsersClient
-from codegen_client.endpoints.agents import AgentsClient
-from codegen_client.endpoints.agents_alpha import AgentsAlphaClient
-from codegen_client.endpoints.organizations import OrganizationsClient
-from codegen_client.endpoints.repositories import RepositoriesClient
-from codegen_client.endpoints.integrations import IntegrationsClient
-from codegen_client.endpoints.setup_commands import SetupCommandsClient
-from codegen_client.endpoints.sandbox import SandboxClient
+from codegen_client.endpoints.users import AsyncUsersClient, UsersClient
+from codegen_client.endpoints.agents import AgentsClient, AsyncAgentsClient
+from codegen_client.endpoints.agents_alpha import AgentsAlphaClient, AsyncAgentsAlphaClient
+from codegen_client.endpoints.organizations import AsyncOrganizationsClient, OrganizationsClient
+from codegen_client.endpoints.repositories import AsyncRepositoriesClient, RepositoriesClient
+from codegen_client.endpoints.integrations import AsyncIntegrationsClient, IntegrationsClient
+from codegen_client.endpoints.setup_commands import AsyncSetupCommandsClient, SetupCommandsClient
+from codegen_client.endpoints.sandbox import AsyncSandboxClient, SandboxClient
+from codegen_client.endpoints.multi_run_agent import AsyncMultiRunAgentClient, MultiRunAgentClient
 
 __all__ = [
     "UsersClient",
@@ -20,5 +21,15 @@ __all__ = [
     "IntegrationsClient",
     "SetupCommandsClient",
     "SandboxClient",
+    "MultiRunAgentClient",
+    "AsyncUsersClient",
+    "AsyncAgentsClient",
+    "AsyncAgentsAlphaClient",
+    "AsyncOrganizationsClient",
+    "AsyncRepositoriesClient",
+    "AsyncIntegrationsClient",
+    "AsyncSetupCommandsClient",
+    "AsyncSandboxClient",
+    "AsyncMultiRunAgentClient",
 ]
 
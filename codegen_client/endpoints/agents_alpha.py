@@ -60,3 +60,55 @@ class AgentsAlphaClient:
         
         return AgentRunResponse.parse_obj(response_data)
 
+
+class AsyncAgentsAlphaClient:
+    """
+    Async client for the Agents Alpha API endpoints.
+
+    Mirrors ``AgentsAlphaClient`` on top of ``AsyncCodegenClient``.
+    """
+
+    def __init__(self, client: Any):
+        """
+        Initialize the async Agents Alpha API client.
+
+        Args:
+            client: The base async API client
+        """
+        self.client = client
+
+    async def get_agent_run_logs(
+        self,
+        org_id: int,
+        agent_run_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        reverse: bool = False,
+    ) -> AgentRunResponse:
+        """
+        Get logs for a specific agent run.
+
+        Args:
+            org_id: Organization ID
+            agent_run_id: Agent run ID
+            skip: Number of items to skip (for pagination)
+            limit: Maximum number of items to return (for pagination)
+            reverse: Whether to reverse the order of the logs
+
+        Returns:
+            AgentRunResponse: Agent run logs
+
+        Raises:
+            CodegenApiError: If the API request fails
+            CodegenResourceNotFoundError: If the agent run is not found
+        """
+        response_data = await self.client.get(
+            f"/alpha/organizations/{org_id}/agent/run/{agent_run_id}/logs",
+            params={
+                "skip": skip,
+                "limit": limit,
+                "reverse": reverse,
+            },
+        )
+
+        return AgentRunResponse.parse_obj(response_data)
@@ -43,3 +43,40 @@ class IntegrationsClient:
             f"/organizations/{org_id}/integrations",
         )
 
+
+class AsyncIntegrationsClient:
+    """
+    Async client for the Integrations API endpoints.
+
+    Mirrors ``IntegrationsClient`` on top of ``AsyncCodegenClient``.
+    """
+
+    def __init__(self, client: Any):
+        """
+        Initialize the async Integrations API client.
+
+        Args:
+            client: The base async API client
+        """
+        self.client = client
+
+    async def get_organization_integrations(
+        self,
+        org_id: int,
+    ) -> Dict[str, Any]:
+        """
+        Get all integration statuses for an organization.
+
+        Args:
+            org_id: Organization ID
+
+        Returns:
+            Dict[str, Any]: Organization integrations data
+
+        Raises:
+            CodegenApiError: If the API request fails
+            CodegenResourceNotFoundError: If the organization is not found
+        """
+        return await self.client.get(
+            f"/organizations/{org_id}/integrations",
+        )
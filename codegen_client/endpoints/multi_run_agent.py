@@ -30,6 +30,40 @@ class MultiRunAgentClient:
         """
         self.client = client
 
+    async def _post_async(self, path: str, data: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Send a POST request from async code.
+
+        The synchronous client is run in the default executor so the event
+        loop is not blocked.
+
+        Args:
+            path: API path (without base URL)
+            data: Request data
+
+        Returns:
+            Any: Response data
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, lambda: self.client.post(path, data=data))
+
+    async def _get_async(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Send a GET request from async code.
+
+        The synchronous client is run in the default executor so the event
+        loop is not blocked.
+
+        Args:
+            path: API path (without base URL)
+            params: Query parameters
+
+        Returns:
+            Any: Response data
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, lambda: self.client.get(path, params=params))
+
     async def _create_agent_run_async(
         self,
         org_id: int,
@@ -70,15 +104,9 @@ class MultiRunAgentClient:
         if metadata is not None:
             data["metadata"] = metadata
             
-        # Use the synchronous client in an async context
-        # In a real implementation, this would use an async HTTP client
-        loop = asyncio.get_event_loop()
-        response_data = await loop.run_in_executor(
-            None,
-            lambda: self.client.post(
-                f"/organizations/{org_id}/agent-runs",
-                data=data,
-            )
+        response_data = await self._post_async(
+            f"/organizations/{org_id}/agent-runs",
+            data=data,
         )
         
         return AgentRun.parse_obj(response_data)
@@ -107,13 +135,8 @@ class MultiRunAgentClient:
         """
         start_time = time.time()
         while True:
-            # Use the synchronous client in an async context
-            loop = asyncio.get_event_loop()
-            response_data = await loop.run_in_executor(
-                None,
-                lambda: self.client.get(
-                    f"/organizations/{org_id}/agent-runs/{agent_run_id}",
-                )
+            response_data = await self._get_async(
+                f"/organizations/{org_id}/agent-runs/{agent_run_id}",
             )
             
             agent_run = AgentRun.parse_obj(response_data)
@@ -331,3 +354,89 @@ class MultiRunAgentClient:
             f"the synthesis process in your response. Be decisive and clear."
         )
 
+
+class AsyncMultiRunAgentClient(MultiRunAgentClient):
+    """
+    Async client for the MultiRunAgent API endpoints.
+
+    Uses ``AsyncCodegenClient`` directly, so every candidate run is driven by
+    the caller's event loop over the shared connection pool instead of
+    occupying an executor thread per in-flight request.
+    """
+
+    async def _post_async(self, path: str, data: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Send a POST request over the async client.
+
+        Args:
+            path: API path (without base URL)
+            data: Request data
+
+        Returns:
+            Any: Response data
+        """
+        return await self.client.post(path, data=data)
+
+    async def _get_async(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Send a GET request over the async client.
+
+        Args:
+            path: API path (without base URL)
+            params: Query parameters
+
+        Returns:
+            Any: Response data
+        """
+        return await self.client.get(path, params=params)
+
+    async def create_multi_run(
+        self,
+        org_id: int,
+        prompt: str,
+        concurrency: int,
+        repo_id: Optional[int] = None,
+        model: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        synthesis_prompt: Optional[str] = None,
+        temperature: float = 0.7,
+        synthesis_temperature: float = 0.2,
+        timeout: float = 600.0,
+    ) -> Dict[str, Any]:
+        """
+        Create multiple agent runs concurrently and synthesize the results.
+
+        Args:
+            org_id: Organization ID
+            prompt: Prompt for the agents
+            concurrency: Number of concurrent agent runs (1-20)
+            repo_id: Optional repository ID
+            model: Optional model to use
+            metadata: Optional metadata
+            synthesis_prompt: Optional custom prompt for synthesis
+            temperature: Temperature for generation (0.0-1.0)
+            synthesis_temperature: Temperature for synthesis (0.0-1.0)
+            timeout: Maximum seconds to wait for completion
+
+        Returns:
+            Dict[str, Any]: Results containing final synthesis and all candidate outputs
+
+        Raises:
+            CodegenApiError: If the API request fails
+            ValueError: If concurrency is out of range
+        """
+        if not 1 <= concurrency <= 20:
+            raise ValueError("Concurrency must be between 1 and 20")
+
+        return await self._create_multi_run_async(
+            org_id=org_id,
+            prompt=prompt,
+            concurrency=concurrency,
+            repo_id=repo_id,
+            model=model,
+            metadata=metadata,
+            synthesis_prompt=synthesis_prompt,
+            temperature=temperature,
+            synthesis_temperature=synthesis_temperature,
+            timeout=timeout,
+        )
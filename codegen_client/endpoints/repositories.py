@@ -5,7 +5,7 @@ Client for the Repositories API endpoints.
 from typing import Any, Dict, List, Optional
 
 from codegen_client.models.repositories import Repository, RepositoryResponse
-from codegen_client.utils.pagination import get_paginated_results
+from codegen_client.utils.pagination import get_paginated_results, get_paginated_results_async
 
 
 class RepositoriesClient:
@@ -81,3 +81,73 @@ class RepositoriesClient:
             limit=limit,
         )
 
+
+class AsyncRepositoriesClient:
+    """
+    Async client for the Repositories API endpoints.
+
+    Mirrors ``RepositoriesClient`` on top of ``AsyncCodegenClient``.
+    """
+
+    def __init__(self, client: Any):
+        """
+        Initialize the async Repositories API client.
+
+        Args:
+            client: The base async API client
+        """
+        self.client = client
+
+    async def get_repositories(
+        self,
+        org_id: int,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> RepositoryResponse:
+        """
+        Get a list of repositories for an organization.
+
+        Args:
+            org_id: Organization ID
+            skip: Number of items to skip (for pagination)
+            limit: Maximum number of items to return (for pagination)
+
+        Returns:
+            RepositoryResponse: Paginated response with repository data
+
+        Raises:
+            CodegenApiError: If the API request fails
+        """
+        response_data = await self.client.get(
+            f"/organizations/{org_id}/repos",
+            params={"skip": skip, "limit": limit},
+        )
+        return RepositoryResponse.parse_obj(response_data)
+
+    async def get_all_repositories(
+        self,
+        org_id: int,
+        limit: Optional[int] = None,
+    ) -> List[Repository]:
+        """
+        Get all repositories for an organization.
+
+        Args:
+            org_id: Organization ID
+            limit: Maximum number of repositories to return (None for all)
+
+        Returns:
+            List[Repository]: List of all repositories in the organization
+
+        Raises:
+            CodegenApiError: If the API request fails
+        """
+        return await get_paginated_results_async(
+            lambda page, page_size: self.get_repositories(
+                org_id=org_id,
+                skip=(page - 1) * page_size,
+                limit=page_size,
+            ),
+            Repository,
+            limit=limit,
+        )
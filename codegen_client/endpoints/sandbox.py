@@ -61,3 +61,56 @@ class SandboxClient:
         
         return AgentRun.parse_obj(response_data)
 
+
+class AsyncSandboxClient:
+    """
+    Async client for the Sandbox API endpoints.
+
+    Mirrors ``SandboxClient`` on top of ``AsyncCodegenClient``.
+    """
+
+    def __init__(self, client: Any):
+        """
+        Initialize the async Sandbox API client.
+
+        Args:
+            client: The base async API client
+        """
+        self.client = client
+
+    async def analyze_sandbox_logs(
+        self,
+        org_id: int,
+        repo_id: int,
+        logs: str,
+        model: Optional[str] = None,
+    ) -> AgentRun:
+        """
+        Analyze sandbox setup logs using an AI agent.
+
+        Args:
+            org_id: Organization ID
+            repo_id: Repository ID
+            logs: Sandbox logs to analyze
+            model: Model to use for analysis
+
+        Returns:
+            AgentRun: Created agent run for log analysis
+
+        Raises:
+            CodegenApiError: If the API request fails
+            CodegenResourceNotFoundError: If the organization or repository is not found
+        """
+        data = {
+            "logs": logs,
+        }
+
+        if model:
+            data["model"] = model
+
+        response_data = await self.client.post(
+            f"/organizations/{org_id}/repos/{repo_id}/sandbox/analyze-logs",
+            data=data,
+        )
+
+        return AgentRun.parse_obj(response_data)
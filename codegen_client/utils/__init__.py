@@ -2,11 +2,16 @@
 Utility functions for the Codegen API client.
 """
 
-from codegen_client.utils.pagination import get_paginated_results
+from codegen_client.utils.coalescing import AsyncSingleFlight, SingleFlight, get_request_key
+from codegen_client.utils.pagination import get_paginated_results, get_paginated_results_async
 from codegen_client.utils.formatting import format_date, format_error_message
 
 __all__ = [
+    "SingleFlight",
+    "AsyncSingleFlight",
+    "get_request_key",
     "get_paginated_results",
+    "get_paginated_results_async",
     "format_date",
     "format_error_message",
 ]
@@ -0,0 +1,165 @@
+"""
+Utilities for coalescing identical in-flight requests.
+"""
+
+import asyncio
+import hashlib
+import json
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+def get_request_key(method: str, path: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Build a key identifying a request.
+
+    Args:
+        method: HTTP method
+        path: API path (without base URL)
+        params: Query parameters
+
+    Returns:
+        str: Hash of the method, path and sorted query parameters
+    """
+    key_parts = [method.upper(), path]
+    if params:
+        key_parts.append(json.dumps(params, sort_keys=True, default=str))
+    return hashlib.md5(":".join(key_parts).encode()).hexdigest()
+
+
+class _Call:
+    """An in-flight call and its outcome."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Share one call among threads that request the same key at the same time.
+
+    The first caller for a key runs the function; callers arriving while it is
+    in flight wait for it and receive the same result or exception.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self._executed = 0
+        self._coalesced = 0
+
+    def do(self, key: str, func: Callable[[], Any]) -> Any:
+        """
+        Run a function, or wait for the in-flight run with the same key.
+
+        Args:
+            key: Key identifying identical calls
+            func: Function to run if no call with this key is in flight
+
+        Returns:
+            Any: Result of the shared call
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._executed += 1
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get coalescing statistics.
+
+        Returns:
+            Dict[str, int]: In-flight, executed and coalesced call counts
+        """
+        with self._lock:
+            return {
+                "in_flight": len(self._calls),
+                "executed": self._executed,
+                "coalesced": self._coalesced,
+            }
+
+
+class AsyncSingleFlight:
+    """
+    Share one coroutine among tasks that request the same key at the same time.
+
+    Must be used from a single event loop.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, asyncio.Future] = {}
+        self._executed = 0
+        self._coalesced = 0
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await a coroutine function, or the in-flight call with the same key.
+
+        Args:
+            key: Key identifying identical calls
+            func: Coroutine function to await if no call with this key is in flight
+
+        Returns:
+            Any: Result of the shared call
+        """
+        future = self._calls.get(key)
+        if future is not None:
+            self._coalesced += 1
+            # Shield the shared call so one waiter's cancellation doesn't cancel it for everyone
+            return await asyncio.shield(future)
+
+        future = self._calls[key] = asyncio.get_running_loop().create_future()
+        self._executed += 1
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved in case nobody else was waiting
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get coalescing statistics.
+
+        Returns:
+            Dict[str, int]: In-flight, executed and coalesced call counts
+        """
+        return {
+            "in_flight": len(self._calls),
+            "executed": self._executed,
+            "coalesced": self._coalesced,
+        }
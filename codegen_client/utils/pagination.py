@@ -3,7 +3,7 @@ Utilities for handling pagination in API responses.
 """
 
 import logging
-from typing import Any, Callable, Dict, List, Optional, TypeVar, cast
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar, cast
 
 from codegen_client.models.base import PaginatedResponse
 
@@ -57,3 +57,39 @@ def get_paginated_results(
     
     return all_items
 
+
+
+async def get_paginated_results_async(
+    fetch_page_func: Callable[[int, int], Awaitable[R]],
+    item_type: type,
+    limit: Optional[int] = None,
+    page_size: int = 100,
+) -> List[T]:
+    """
+    Fetch all pages of paginated results from an async fetch function.
+
+    Args:
+        fetch_page_func: Coroutine function that fetches a page of results
+        item_type: Type of the items in the response
+        limit: Maximum number of items to fetch (None for all)
+        page_size: Number of items per page
+
+    Returns:
+        List[T]: All items from all pages
+    """
+    all_items: List[T] = []
+    page = 1
+    total_pages = 1  # Will be updated after first request
+
+    while page <= total_pages:
+        response = await fetch_page_func(page, page_size)
+        all_items.extend(cast(List[T], response.items))
+        total_pages = response.pages
+
+        if limit and len(all_items) >= limit:
+            all_items = all_items[:limit]
+            break
+
+        page += 1
+
+    return all_items
@@ -0,0 +1,314 @@
+"""
+Tests for the FastAPI backend.
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.client_registry import ClientRegistry
+from backend.fastapi_app_complete import app
+from backend.log_stream import LogStreamHub, parse_last_event_id
+from backend.route_executor import RouteExecutor, RouteOverloadedError
+from codegen_client.models.agents import AgentRunLog, AgentRunResponse
+
+
+class _FakeClient:
+    """Minimal stand-in for CodegenClient that records closes."""
+
+    def __init__(self, api_key):
+        self.api_key = api_key
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+    def get_stats(self):
+        return {"closed": self.closed}
+
+
+class TestClientRegistry:
+    """Tests for the bounded registry of long-lived clients."""
+
+    def test_same_key_reuses_client(self):
+        """Repeated leases for one API key share a single client."""
+        registry = ClientRegistry(max_clients=2, client_factory=_FakeClient)
+
+        with registry.lease("key-a") as first, registry.lease("key-a") as second:
+            assert first is second
+
+        metrics = registry.get_metrics()
+        assert metrics["hits"] == 1
+        assert metrics["misses"] == 1
+        assert metrics["tenants"][0]["total_leases"] == 2
+        assert "key-a" not in str(metrics)
+
+    def test_evicts_least_recently_used_client(self):
+        """The least recently used client is evicted and closed."""
+        registry = ClientRegistry(max_clients=2, client_factory=_FakeClient)
+        with registry.lease("key-a") as client_a:
+            pass
+        with registry.lease("key-b"):
+            pass
+        with registry.lease("key-a"):
+            pass
+        with registry.lease("key-c"):
+            pass
+
+        assert len(registry) == 2
+        assert registry.get_metrics()["evictions"] == 1
+        assert not client_a.closed
+        with registry.lease("key-b") as client_b:
+            assert registry.get_metrics()["misses"] == 4
+        assert not client_b.closed
+
+    def test_evicted_client_closes_after_last_lease(self):
+        """A client evicted while in use is closed once its lease is released."""
+        registry = ClientRegistry(max_clients=1, client_factory=_FakeClient)
+
+        client_a = registry.acquire("key-a")
+        with registry.lease("key-b"):
+            assert not client_a.closed
+        registry.release(client_a)
+
+        assert client_a.closed
+
+    def test_close_closes_all_clients(self):
+        """Closing the registry closes every client."""
+        registry = ClientRegistry(client_factory=_FakeClient)
+        with registry.lease("key-a") as client:
+            pass
+
+        registry.close()
+
+        assert client.closed
+        assert len(registry) == 0
+
+
+class TestRouteExecutor:
+    """Tests for running blocking route calls off the event loop."""
+
+    def test_blocking_calls_run_concurrently(self):
+        """Blocking calls overlap instead of serializing on the event loop."""
+        executor = RouteExecutor(max_workers=4)
+
+        async def run():
+            start = time.monotonic()
+            results = await asyncio.gather(*(executor.run(time.sleep, 0.1) for _ in range(4)))
+            return results, time.monotonic() - start
+
+        results, elapsed = asyncio.run(run())
+        executor.shutdown(wait=True)
+
+        assert results == [None] * 4
+        assert elapsed < 0.3
+        assert executor.get_metrics()["executor"]["calls"] == 4
+
+    def test_route_limit_and_queue_depth(self):
+        """Requests beyond a route's limit wait, and are rejected once the queue is full."""
+        executor = RouteExecutor(default_concurrency=1, max_queue_depth=1)
+
+        async def hold(release):
+            async with executor.slot("get_agent_run"):
+                await release.wait()
+
+        async def run():
+            release = asyncio.Event()
+            holder = asyncio.create_task(hold(release))
+            waiter = asyncio.create_task(hold(release))
+            await asyncio.sleep(0)
+            metrics = executor.get_metrics()["routes"]["get_agent_run"]
+            with pytest.raises(RouteOverloadedError):
+                async with executor.slot("get_agent_run"):
+                    pass
+            release.set()
+            await asyncio.gather(holder, waiter)
+            return metrics
+
+        metrics = asyncio.run(run())
+        final = executor.get_metrics()["routes"]["get_agent_run"]
+        executor.shutdown()
+
+        assert metrics["in_flight"] == 1
+        assert metrics["waiting"] == 1
+        assert final["completed"] == 2
+        assert final["rejected"] == 1
+
+
+def _log_page(status, start, count):
+    """Build a page of agent run logs numbered from ``start``."""
+    logs = [
+        AgentRunLog(agent_run_id=1, created_at="2024-01-01T00:00:00", thought=f"log {i}")
+        for i in range(start, start + count)
+    ]
+    return AgentRunResponse(
+        id=1, organization_id=1, status=status, created_at="2024-01-01T00:00:00", logs=logs
+    )
+
+
+def _parse_events(chunks):
+    """Decode the ``id`` and ``data`` fields of streamed events."""
+    events = []
+    for chunk in chunks:
+        fields = dict(line.split(": ", 1) for line in chunk.strip().split("\n"))
+        if "data" in fields:
+            events.append((fields.get("id"), json.loads(fields["data"])))
+    return events
+
+
+class TestLogStreamHub:
+    """Tests for the shared, incremental agent run log poller."""
+
+    def test_fetches_only_new_logs(self):
+        """Each poll starts at the cursor and the stream ends on a terminal status."""
+        pages = [_log_page("RUNNING", 0, 2), _log_page("RUNNING", 2, 0), _log_page("COMPLETED", 2, 1)]
+        skips = []
+
+        async def fetch_logs(skip, limit):
+            skips.append(skip)
+            return pages.pop(0)
+
+        async def run():
+            hub = LogStreamHub(poll_interval=0, page_size=10)
+            return [chunk async for chunk in hub.stream(1, "1", fetch_logs)]
+
+        events = _parse_events(asyncio.run(run()))
+
+        assert skips == [0, 2, 2]
+        assert [event_id for event_id, _ in events[:3]] == ["0", "1", "2"]
+        assert events[2][1]["thought"] == "log 2"
+        assert events[3] == (None, {"event": "end", "status": "COMPLETED", "total_logs": 3})
+
+    def test_drains_full_pages_before_sleeping(self):
+        """A full page is followed immediately by a request for the next one."""
+        pages = [_log_page("RUNNING", 5, 2), _log_page("COMPLETED", 7, 1)]
+        skips = []
+
+        async def fetch_logs(skip, limit):
+            skips.append(skip)
+            return pages.pop(0)
+
+        async def run():
+            hub = LogStreamHub(poll_interval=60, page_size=2)
+            return [chunk async for chunk in hub.stream(1, "1", fetch_logs, cursor=5)]
+
+        events = _parse_events(asyncio.run(run()))
+
+        assert skips == [5, 7]
+        assert [data["id"] for _, data in events[:3]] == [5, 6, 7]
+
+    def test_error_ends_stream(self):
+        """Upstream errors are reported to the client as an error event."""
+
+        async def fetch_logs(skip, limit):
+            raise RuntimeError("upstream down")
+
+        async def run():
+            hub = LogStreamHub(poll_interval=0)
+            return [chunk async for chunk in hub.stream(1, "1", fetch_logs)]
+
+        events = _parse_events(asyncio.run(run()))
+
+        assert events == [(None, {"event": "error", "message": "upstream down"})]
+
+    def test_subscribers_share_one_poller(self):
+        """A second subscriber replays the buffer and then shares the first one's polls."""
+        release = asyncio.Event
+        calls = []
+
+        async def run():
+            finish = release()
+
+            async def first_fetch(skip, limit):
+                calls.append(("first", skip, limit))
+                if skip == 0:
+                    return _log_page("RUNNING", 0, 3)
+                await finish.wait()
+                return _log_page("COMPLETED", skip, 1)
+
+            async def second_fetch(skip, limit):
+                calls.append(("second", skip, limit))
+                return _log_page("RUNNING", skip, 1)
+
+            hub = LogStreamHub(poll_interval=0, page_size=10)
+            first = await hub.subscribe(1, "1", first_fetch)
+            first_logs = [await first.get() for _ in range(3)]
+
+            second = await hub.subscribe(1, "1", second_fetch, cursor=1)
+            assert hub.get_metrics()["subscribers"] == 2
+            finish.set()
+
+            received = []
+            while True:
+                event_id, data, final = await second.get()
+                received.append(event_id)
+                if final:
+                    break
+            assert (await first.get())[0] == 3
+
+            hub.unsubscribe(first)
+            hub.unsubscribe(second)
+            return first_logs, received, hub.get_metrics()
+
+        first_logs, received, metrics = asyncio.run(run())
+
+        assert [event_id for event_id, _, _ in first_logs] == [0, 1, 2]
+        assert received == [1, 2, 3, None]
+        # The second subscriber only fetched one log to confirm access
+        assert calls == [("first", 0, 10), ("first", 3, 10), ("second", 1, 1)]
+        assert metrics["watched_runs"] == 0
+
+    def test_last_unsubscribe_stops_poller(self):
+        """The poller is cancelled once its only subscriber leaves."""
+
+        async def fetch_logs(skip, limit):
+            return _log_page("RUNNING", skip, 0)
+
+        async def run():
+            hub = LogStreamHub(poll_interval=60)
+            subscription = await hub.subscribe(1, "1", fetch_logs)
+            await asyncio.sleep(0)
+            task = hub._watches[(1, "1")].task
+            hub.unsubscribe(subscription)
+            await asyncio.sleep(0)
+            return task.cancelled(), hub.get_metrics()["watched_runs"]
+
+        assert asyncio.run(run()) == (True, 0)
+
+    def test_parse_last_event_id(self):
+        """Only non-negative integer event IDs can be resumed from."""
+        assert parse_last_event_id("41") == 41
+        assert parse_last_event_id(None) is None
+        assert parse_last_event_id("abc") is None
+        assert parse_last_event_id("-1") is None
+
+
+class TestAdminEndpoints:
+    """Tests for the backend admin endpoints."""
+
+    def test_client_metrics_endpoint(self):
+        """The registry is created on startup and reported by the admin endpoint."""
+        with TestClient(app) as test_client:
+            response = test_client.get("/admin/clients")
+
+        assert response.status_code == 200
+        assert response.json()["clients"] == 0
+
+    def test_route_metrics_endpoint(self):
+        """Route executor metrics are reported by the admin endpoint."""
+        with TestClient(app) as test_client:
+            response = test_client.get("/admin/routes")
+
+        assert response.status_code == 200
+        assert response.json()["executor"]["max_workers"] > 0
+
+    def test_log_stream_metrics_endpoint(self):
+        """Log stream hub metrics are reported by the admin endpoint."""
+        with TestClient(app) as test_client:
+            response = test_client.get("/admin/log-streams")
+
+        assert response.status_code == 200
+        assert response.json()["watched_runs"] == 0
@@ -0,0 +1,208 @@
+"""
+Tests for the single-module codegen_api client utilities.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+import requests
+
+from codegen_api import (
+    CacheManager,
+    ClientConfig,
+    CodegenClient,
+    MetricsCollector,
+    RateLimiter,
+)
+
+
+class TestRateLimiter:
+    """Tests for the token-bucket RateLimiter."""
+
+    def test_burst_is_not_throttled(self):
+        """Requests within the burst capacity do not wait."""
+        limiter = RateLimiter(requests_per_period=5, period_seconds=60)
+
+        waits = [limiter._reserve() for _ in range(5)]
+
+        assert waits == [0.0] * 5
+
+    def test_waits_are_spaced_by_refill_rate(self):
+        """Requests past the burst are spaced out instead of released together."""
+        limiter = RateLimiter(requests_per_period=10, period_seconds=1, burst=1)
+
+        limiter._reserve()
+        second = limiter._reserve()
+        third = limiter._reserve()
+
+        assert 0.05 < second <= 0.1
+        assert 0.15 < third <= 0.2
+
+    def test_async_acquire_does_not_block_event_loop(self):
+        """A throttled coroutine yields to other coroutines while waiting."""
+        limiter = RateLimiter(requests_per_period=20, period_seconds=1, burst=1)
+        ticks = []
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        async def run():
+            await limiter.acquire()
+            await asyncio.gather(limiter.acquire(), ticker())
+
+        asyncio.run(run())
+
+        assert len(ticks) == 5
+
+    def test_waits_reported_to_metrics(self):
+        """Imposed waits are recorded on the metrics collector."""
+        metrics = MetricsCollector()
+        limiter = RateLimiter(requests_per_period=100, period_seconds=1, burst=1, metrics=metrics)
+
+        limiter.wait_if_needed()
+        limiter.wait_if_needed()
+
+        stats = metrics.get_stats()
+        assert stats.rate_limit_waits == 1
+        assert stats.rate_limit_wait_seconds > 0
+
+    def test_current_usage(self):
+        """Usage reports consumed and available tokens."""
+        limiter = RateLimiter(requests_per_period=4, period_seconds=60)
+        limiter.wait_if_needed()
+
+        usage = limiter.get_current_usage()
+
+        assert usage["max_requests"] == 4
+        assert usage["burst"] == 4
+        assert round(usage["current_requests"]) == 1
+
+
+class TestCacheManager:
+    """Tests for CacheManager eviction and expiry."""
+
+    def test_lru_evicts_least_recently_used(self):
+        """Reading a key protects it from the next eviction."""
+        cache = CacheManager(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_lfu_evicts_least_frequently_used(self):
+        """The least frequently read key is evicted, oldest first on ties."""
+        cache = CacheManager(max_size=2, eviction_policy="lfu")
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.get("a")
+        cache.get("b")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_expired_entries_are_purged(self):
+        """Expired entries miss on lookup and are dropped on the next write."""
+        cache = CacheManager(max_size=10, ttl_seconds=0)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        assert cache.get("a") is None
+        assert cache.get_stats()["size"] == 1
+
+    def test_byte_budget_limits_total_size(self):
+        """Entries are evicted to fit the byte budget and oversized values are skipped."""
+        cache = CacheManager(max_size=10, max_bytes=20)
+        cache.set("a", "x" * 9)
+        cache.set("b", "y" * 9)
+        cache.set("too_big", "z" * 50)
+
+        stats = cache.get_stats()
+        assert cache.get("too_big") is None
+        assert cache.get("a") is None
+        assert cache.get("b") == "y" * 9
+        assert stats["total_bytes"] <= 20
+
+    def test_rejects_unknown_policy(self):
+        """Unsupported eviction policies are rejected up front."""
+        with pytest.raises(ValueError):
+            CacheManager(eviction_policy="fifo")
+
+
+class _RecordingSession:
+    """Stands in for requests.Session and replays canned responses."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def request(self, method, url, timeout=None, **kwargs):
+        self.calls.append(kwargs)
+        return self.responses.pop(0)
+
+    def close(self):
+        pass
+
+
+def _response(status_code, body=b"", headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response.headers.update(headers or {})
+    return response
+
+
+class TestConditionalCaching:
+    """Tests for ETag revalidation and stale-while-revalidate in CodegenClient."""
+
+    def _client(self, **overrides):
+        config = ClientConfig(
+            api_token="test-token",
+            cache_ttl_seconds=0,
+            cache_stale_ttl_seconds=60,
+            log_requests=False,
+            **overrides,
+        )
+        return CodegenClient(config)
+
+    def test_not_modified_renews_stale_entry(self):
+        """A 304 reuses the cached body and the validators are sent upstream."""
+        client = self._client()
+        client.session = _RecordingSession(
+            _response(200, b'{"id": 1}', {"ETag": '"v1"'}),
+            _response(304),
+        )
+
+        first = client._make_request("GET", "/users/me", use_cache=True)
+        second = client._make_request("GET", "/users/me", use_cache=True)
+
+        assert first == second == {"id": 1}
+        assert client.session.calls[1]["headers"]["If-None-Match"] == '"v1"'
+        assert client.cache.get_stats()["revalidations"] == 1
+
+    def test_stale_entry_is_served_while_refreshing(self):
+        """Stale entries are returned immediately and refreshed in the background."""
+        client = self._client(cache_stale_while_revalidate=True)
+        client.session = _RecordingSession(
+            _response(200, b'{"id": 1}', {"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}),
+            _response(200, b'{"id": 2}'),
+        )
+
+        client._make_request("GET", "/users/me", use_cache=True)
+        stale = client._make_request("GET", "/users/me", use_cache=True)
+        client._refresh_executor.shutdown(wait=True)
+
+        assert stale == {"id": 1}
+        assert len(client.session.calls) == 2
+        assert "If-Modified-Since" in client.session.calls[1]["headers"]
+        assert [entry.value for entry in client.cache._cache.values()] == [{"id": 2}]
@@ -0,0 +1,171 @@
+"""
+Tests for the codegen_client HTTP transport.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from codegen_client import AsyncCodegenClient, CodegenApiError, CodegenClient
+
+
+def _mock_http(handler):
+    """Build a pooled HTTP client backed by a mock transport."""
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+class TestPooledTransport:
+    """Tests for the shared connection pool owned by CodegenClient."""
+
+    def test_config_defaults_when_arguments_omitted(self):
+        """Omitted arguments fall back to configuration defaults."""
+        client = CodegenClient(api_key="test-key")
+
+        assert client.config.api_key == "test-key"
+        assert client.config.base_url == "https://api.codegen.com/v1"
+        assert client.config.max_connections == 100
+        client.close()
+
+    def test_endpoint_clients_share_one_pool(self):
+        """All endpoint clients send requests through the same HTTP client."""
+        seen = []
+
+        def handler(request):
+            seen.append(request.url.path)
+            return httpx.Response(200, json={"ok": True})
+
+        client = CodegenClient(api_key="test-key", base_url="https://example.test")
+        client._http = _mock_http(handler)
+
+        client.users.get_current_user_info()
+        client.integrations.get_organization_integrations(org_id=1)
+        client.agents.list_agent_runs(org_id=1)
+
+        assert seen == [
+            "/users/me",
+            "/organizations/1/integrations",
+            "/organizations/1/agent/runs",
+        ]
+        stats = client.get_pool_stats()
+        assert stats["total_requests"] == 3
+        assert stats["in_flight_requests"] == 0
+        client.close()
+
+    def test_context_manager_closes_pool(self):
+        """Leaving the context manager closes the pooled connections."""
+        with CodegenClient(api_key="test-key") as client:
+            assert not client.closed
+
+        assert client.closed
+        assert client.get_pool_stats()["closed"] is True
+
+    def test_request_after_close_fails(self):
+        """Requests on a closed client raise instead of opening new sockets."""
+        client = CodegenClient(api_key="test-key")
+        client.close()
+
+        with pytest.raises(RuntimeError):
+            client.get("/users/me")
+
+
+class TestAsyncClient:
+    """Tests for AsyncCodegenClient and its async endpoint clients."""
+
+    def test_async_endpoint_clients_share_one_pool(self):
+        """Async endpoint clients await requests over the same HTTP client."""
+        seen = []
+
+        async def handler(request):
+            seen.append(request.url.path)
+            return httpx.Response(200, json={"id": 1})
+
+        async def run():
+            async with AsyncCodegenClient(api_key="test-key", base_url="https://example.test") as client:
+                client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+                await asyncio.gather(
+                    client.users.get_current_user_info(),
+                    client.integrations.get_organization_integrations(org_id=1),
+                )
+                return client.get_pool_stats()
+
+        stats = asyncio.run(run())
+
+        assert sorted(seen) == ["/organizations/1/integrations", "/users/me"]
+        assert stats["total_requests"] == 2
+
+    def test_multi_run_uses_async_transport(self):
+        """Async multi-run posts candidate runs without an executor."""
+        created = []
+
+        async def handler(request):
+            created.append(request.url.path)
+            return httpx.Response(
+                200,
+                json={"id": len(created), "organization_id": 1, "status": "pending", "created_at": "now"},
+            )
+
+        async def run():
+            async with AsyncCodegenClient(api_key="test-key", base_url="https://example.test") as client:
+                client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+                return await client.multi_run_agent._create_agent_run_async(org_id=1, prompt="hi")
+
+        run_result = asyncio.run(run())
+
+        assert run_result.id == 1
+        assert created == ["/organizations/1/agent-runs"]
+
+
+class TestRequestCoalescing:
+    """Tests for single-flight coalescing of identical GET requests."""
+
+    def test_concurrent_gets_share_one_request(self):
+        """Threads issuing the same GET at once trigger a single upstream call."""
+        calls = []
+        client = CodegenClient(api_key="test-key", base_url="https://example.test")
+
+        def handler(request):
+            calls.append(request.url.path)
+            # Hold the request open until the other callers have joined it
+            deadline = time.time() + 2
+            while client.get_stats()["coalescing"]["coalesced"] < 4 and time.time() < deadline:
+                time.sleep(0.01)
+            return httpx.Response(200, json={"id": 7})
+
+        client._http = _mock_http(handler)
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            results = list(executor.map(lambda _: client.get("/organizations/1/agent/run/7"), range(5)))
+
+        assert calls == ["/organizations/1/agent/run/7"]
+        assert results == [{"id": 7}] * 5
+        assert client.get_stats()["coalescing"] == {"in_flight": 0, "executed": 1, "coalesced": 4}
+        client.close()
+
+    def test_async_waiters_share_result_and_errors(self):
+        """Concurrent async GETs share one call, including its exception."""
+        calls = []
+
+        async def handler(request):
+            calls.append(request.url.path)
+            await asyncio.sleep(0.05)
+            if request.url.path.endswith("missing"):
+                return httpx.Response(404, json={"message": "not found"})
+            return httpx.Response(200, json={"id": 1})
+
+        async def run():
+            async with AsyncCodegenClient(api_key="test-key", base_url="https://example.test") as client:
+                client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+                found = await asyncio.gather(*(client.get("/users/me") for _ in range(3)))
+                missing = await asyncio.gather(
+                    *(client.get("/users/missing") for _ in range(3)), return_exceptions=True
+                )
+                return found, missing, client.get_stats()["coalescing"]
+
+        found, missing, stats = asyncio.run(run())
+
+        assert found == [{"id": 1}] * 3
+        assert all(isinstance(error, CodegenApiError) for error in missing)
+        assert calls == ["/users/me", "/users/missing"]
+        assert stats["coalesced"] == 4